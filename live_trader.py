@@ -52,6 +52,7 @@ from modules.module2_sentiment import SentimentAnalyzer
 from modules.module3_prediction import BitcoinPricePredictor
 from decision_box.trading_logic import TradingDecisionBox
 from execution.binance_executor import BinanceExecutor
+from utils.logging_setup import start_queue_logging
 
 # Load environment variables
 load_dotenv()
@@ -108,7 +109,8 @@ class LiveTrader:
             self.predictor = BitcoinPricePredictor(
                 window_size=7,
                 horizon=7,
-                use_direction_classifier=True
+                use_direction_classifier=True,
+                model_cache_dir='data/processed/models'  # Skip retraining on restart if data unchanged
             )
             self.decision_box = TradingDecisionBox(config=self.config, telegram_enabled=True, gmail_enabled=True)
             print("[OK] All components initialized", flush=True)
@@ -710,6 +712,9 @@ class LiveTrader:
         print(f"[INFO] Check interval: {self.check_interval}s ({self.check_interval/60:.1f} min)", flush=True)
         print(f"[INFO] Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", flush=True)
 
+        # Push-based price/balance updates (falls back to REST if unavailable)
+        self.executor.start_streams()
+
         try:
             while True:
                 # Run trading cycle
@@ -728,6 +733,8 @@ class LiveTrader:
             print(f"\n\n[INFO] Stopped by user (Ctrl+C)")
 
         finally:
+            self.executor.stop_streams()
+
             # Print final performance report
             self._print_final_report()
 
@@ -865,6 +872,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Executor telemetry goes through logging (queued, written off the trading loop)
+    listener = start_queue_logging()
+
     # Initialize live trader
     trader = LiveTrader(
         initial_capital=args.capital,
@@ -873,7 +883,10 @@ def main():
     )
 
     # Run
-    trader.run(duration_hours=args.duration)
+    try:
+        trader.run(duration_hours=args.duration)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
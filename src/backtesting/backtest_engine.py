@@ -52,7 +52,7 @@ from typing import Dict
 from datetime import datetime
 
 from src.decision_box.trading_logic import TradingDecisionBox
-from src.modules.module1_technical import get_latest_indicators
+from src.modules.module1_technical import calculate_indicators, get_latest_indicators
 from src.modules.module2_sentiment import SentimentAnalyzer
 from src.modules.module3_prediction import BitcoinPricePredictor
 
@@ -225,6 +225,10 @@ class BacktestEngine:
 
         retrain_count = 0  # Track number of retrainings
 
+        # Module 1 indicators are causal, so compute them once for the whole
+        # history and look up each day (row for day T only uses data <= T)
+        df_with_ind = calculate_indicators(self.df, self.df['Date'].max())
+
         for i, current_date in enumerate(test_dates):
             # Periodic retraining logic
             if self.retrain_frequency > 0 and i > 0 and i % self.retrain_frequency == 0:
@@ -256,7 +260,8 @@ class BacktestEngine:
 
             # Module 1: Technical indicators (with anti-future-data filter)
             try:
-                technical = get_latest_indicators(self.df, current_date_str)
+                # normalize() == Timestamp(current_date_str), without re-parsing the string
+                technical = get_latest_indicators(self.df, current_date.normalize(), df_with_ind=df_with_ind)
             except Exception as e:
                 # Skip if insufficient data for indicators
                 if verbose and show_detailed:
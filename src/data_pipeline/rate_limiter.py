@@ -4,7 +4,7 @@ RATE LIMITER - API Request Management
 
 
 PURPOSE:
-    Prevent API rate limit violations using leaky bucket algorithm
+    Prevent API rate limit violations using token bucket algorithm
     and intelligent caching to minimize redundant requests.
 
 SUCCESS CRITERIA:
@@ -27,69 +27,80 @@ VALIDATION METHOD:
 
 import time
 import threading
-from collections import deque
 from typing import Any, Callable, Optional
 from functools import wraps
 import hashlib
 import json
 
 
-class LeakyBucket:
+class TokenBucket:
     """
-    Leaky bucket rate limiter.
+    Token bucket rate limiter.
 
     Allows burst requests up to bucket capacity, then enforces
-    steady rate based on leak rate.
+    steady rate based on refill rate. State is a single
+    [tokens, last_refill] pair, so each check is O(1) arithmetic
+    instead of scanning a deque of request timestamps.
 
     Example:
-        limiter = LeakyBucket(max_requests=100, time_window=60)
+        limiter = TokenBucket(max_requests=100, time_window=60)
         limiter.acquire()  # Blocks if rate limit would be exceeded
+        limiter.acquire(weight=10)  # Weighted endpoint (e.g., Binance /account)
     """
 
     def __init__(self, max_requests: int, time_window: float):
         """
-        Initialize leaky bucket.
+        Initialize token bucket.
 
         Args:
-            max_requests: Maximum requests allowed in time window
+            max_requests: Maximum requests (weight) allowed in time window
             time_window: Time window in seconds
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = deque()  # Timestamps of requests
+        self.refill_rate = max_requests / time_window  # Tokens per second
+        self._state = [float(max_requests), time.monotonic()]  # [tokens, last_refill]
+        # CPython has no user-level CAS; the lock only guards O(1) arithmetic
         self.lock = threading.Lock()
 
-    def acquire(self, blocking: bool = True) -> bool:
+    def _refill(self, now: float) -> float:
+        """Add tokens earned since last refill (caller must hold lock)."""
+        state = self._state
+        tokens = min(self.max_requests, state[0] + (now - state[1]) * self.refill_rate)
+        state[0] = tokens
+        state[1] = now
+        return tokens
+
+    def acquire(self, blocking: bool = True, weight: int = 1) -> bool:
         """
         Acquire permission to make a request.
 
         Args:
             blocking: If True, wait until request is allowed.
                      If False, return immediately.
+            weight: Number of tokens this request costs
 
         Returns:
             True if request is allowed, False if rate limited (when blocking=False)
         """
+        if weight > self.max_requests:
+            raise ValueError(f"weight {weight} exceeds bucket capacity {self.max_requests}")
+
         while True:
             with self.lock:
-                now = time.time()
-
-                # Remove requests outside time window (leak)
-                while self.requests and self.requests[0] < now - self.time_window:
-                    self.requests.popleft()
+                tokens = self._refill(time.monotonic())
 
                 # Check if we can make a request
-                if len(self.requests) < self.max_requests:
-                    self.requests.append(now)
+                if tokens >= weight:
+                    self._state[0] = tokens - weight
                     return True
 
                 # Rate limit reached
                 if not blocking:
                     return False
 
-                # Calculate wait time
-                oldest_request = self.requests[0]
-                wait_time = (oldest_request + self.time_window) - now
+                # Calculate wait time until enough tokens refill
+                wait_time = (weight - tokens) / self.refill_rate
 
             # Wait outside the lock to allow other threads
             if wait_time > 0:
@@ -108,27 +119,20 @@ class LeakyBucket:
             }
         """
         with self.lock:
-            now = time.time()
+            tokens = self._refill(time.monotonic())
 
-            # Clean old requests
-            while self.requests and self.requests[0] < now - self.time_window:
-                self.requests.popleft()
+        used = self.max_requests - tokens
 
-            current_requests = len(self.requests)
-            utilization = current_requests / self.max_requests
+        return {
+            'current_requests': int(round(used)),
+            'max_requests': self.max_requests,
+            'utilization': used / self.max_requests,
+            'time_until_reset': max(0, used / self.refill_rate)
+        }
 
-            # Time until oldest request expires
-            if self.requests:
-                time_until_reset = (self.requests[0] + self.time_window) - now
-            else:
-                time_until_reset = 0
 
-            return {
-                'current_requests': current_requests,
-                'max_requests': self.max_requests,
-                'utilization': utilization,
-                'time_until_reset': max(0, time_until_reset)
-            }
+# Backwards-compatible name
+LeakyBucket = TokenBucket
 
 
 class RequestCache:
@@ -293,7 +297,7 @@ class RateLimiter:
             cache_ttl: Cache time-to-live in seconds
             name: Name for this limiter (for logging)
         """
-        self.bucket = LeakyBucket(max_requests, time_window)
+        self.bucket = TokenBucket(max_requests, time_window)
         self.cache = RequestCache(ttl=cache_ttl)
         self.name = name
 
@@ -351,6 +355,30 @@ class RateLimiter:
 
         return wrapper
 
+    def consume_n(self, weight: int, blocking: bool = True) -> bool:
+        """
+        Consume request weight without going through the decorator.
+
+        Use for calls that are not wrapped by @limit, or for endpoints
+        whose weight is above 1 (e.g., Binance /exchangeInfo).
+
+        Args:
+            weight: Number of tokens to consume
+            blocking: If True, wait until tokens are available
+
+        Returns:
+            True if tokens were consumed, False if rate limited (when blocking=False)
+        """
+        acquired = self.bucket.acquire(blocking=blocking, weight=weight)
+
+        with self.stats_lock:
+            if acquired:
+                self.stats['total_requests'] += 1
+            else:
+                self.stats['rate_limited'] += 1
+
+        return acquired
+
     def get_stats(self) -> dict:
         """
         Get comprehensive statistics.
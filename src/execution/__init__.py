@@ -2,6 +2,6 @@
 Execution package for live trading on Binance Testnet.
 """
 
-from .binance_executor import BinanceExecutor
+from .binance_executor import BinanceExecutor, BinanceAPIError
 
-__all__ = ['BinanceExecutor']
+__all__ = ['BinanceExecutor', 'BinanceAPIError']
@@ -31,11 +31,18 @@ import os
 import sys
 import time
 import hmac
-import hashlib
+import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 from dotenv import load_dotenv
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, ROUND_DOWN
+from dataclasses import dataclass, asdict
 from urllib.parse import urlencode
 from pathlib import Path
 
@@ -46,14 +53,134 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 try:
     from ..data_pipeline.rate_limiter import binance_limiter
     from ..notifications.telegram_notifier import TelegramNotifier
+    from ..utils.logging_setup import console_logger, start_queue_logging
 except (ImportError, ValueError):
     from src.data_pipeline.rate_limiter import binance_limiter
     from src.notifications.telegram_notifier import TelegramNotifier
+    from src.utils.logging_setup import console_logger, start_queue_logging
+
+# Prints to stdout even when logging is not configured (queued once
+# start_queue_logging runs)
+log = console_logger(__name__)
+
+# Optional: orjson decodes API responses several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: ijson streams large order responses (fills) as they arrive
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Order responses at least this large are stream-parsed when ijson is installed
+# (chunked or compressed responses, whose size is unknown, are always streamed)
+STREAM_PARSE_MIN_BYTES = 4096
+
+# Optional: websockets enables push-based price/balance streams
+try:
+    import asyncio
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+# Streamed price older than this (seconds) falls back to REST
+STREAM_PRICE_MAX_AGE = 10.0
+
+# Binance expires listenKeys after 60 min; keep-alive every 30 min
+LISTEN_KEY_KEEPALIVE = 30 * 60
 
 # Load environment variables
 load_dotenv()
 
 
+def _decode_json(content: bytes) -> Dict:
+    """Decode a JSON response body, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class BinanceAPIError(Exception):
+    """Error payload returned by the Binance API ({'code': ..., 'msg': ...})."""
+
+    def __init__(self, code: object, msg: str) -> None:
+        self.code = code
+        self.msg = msg
+        super().__init__(f"Binance API error [{code}]: {msg}")
+
+
+def _stream_worthwhile(headers: Mapping[str, str]) -> bool:
+    """
+    Whether an order response is large enough to stream-parse.
+
+    Content-Length is the body size only for an uncompressed response; a
+    chunked response has none and a gzip one gives the compressed size, so
+    those are streamed rather than assumed small.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        True unless the body is known to be below STREAM_PARSE_MIN_BYTES
+    """
+    length = headers.get('Content-Length')
+    if length is None or headers.get('Content-Encoding', 'identity') != 'identity':
+        return True
+    return int(length) >= STREAM_PARSE_MIN_BYTES
+
+
+def _stream_order_response(raw: Any) -> Dict:
+    """
+    Stream-parse an order response, summing fills while the body arrives.
+
+    Args:
+        raw: File-like response body (urllib3 raw stream)
+
+    Returns:
+        Top-level response fields, with 'fills' replaced by an empty list
+        and the aggregates stored under '_fills_totals' as (total_qty, total_value)
+    """
+    result = {}
+    total_qty = 0.0
+    total_value = 0.0
+    fill = {}
+
+    for prefix, event, value in ijson.parse(raw):
+        if prefix.startswith('fills.item'):
+            if prefix == 'fills.item.price' or prefix == 'fills.item.qty':
+                fill[prefix[11:]] = float(value)
+            elif prefix == 'fills.item' and event == 'end_map':
+                qty = fill.get('qty', 0.0)
+                total_qty += qty
+                total_value += fill.get('price', 0.0) * qty
+                fill = {}
+        elif prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+            # ijson yields Decimal for numbers
+            if event == 'number':
+                value = int(value) if value == int(value) else float(value)
+            result[prefix] = value
+
+    result['fills'] = []
+    result['_fills_totals'] = (total_qty, total_value)
+    return result
+
+
+@dataclass
+class ExecStats:
+    """Fixed-schema order counters (cheaper to update than a dict)."""
+    orders_placed: int = 0
+    orders_failed: int = 0
+    buy_orders: int = 0
+    sell_orders: int = 0
+    total_volume_usd: float = 0.0
+
+
 class BinanceExecutor:
     """
     Executes live trades on Binance Spot Testnet.
@@ -63,9 +190,56 @@ class BinanceExecutor:
     - Account balance tracking
     - Order confirmation
     - Error handling and retries
+
+    Note:
+        Attributes are declared in __slots__ (no per-instance __dict__).
+        Subclasses adding attributes must declare their own __slots__.
     """
 
-    def __init__(self, use_testnet: bool = True):
+    __slots__ = (
+        'api_key', 'api_secret', '_api_secret_bytes',
+        'base_url', 'env_name', 'symbol', 'timeout',
+        '_session', '_signed_session', '_order_prefixes', '_lot_step',
+        '_time_ns', '_monotonic_ns', '_urlencode', '_from_ts',
+        '_time_offset_ms', '_time_synced', 'stats', 'telegram',
+        '_ws_base', '_ws_price', '_ws_price_ts', '_ws_balances',
+        '_ws_user_live', '_ws_await_update_ms', '_ws_thread', '_ws_stop'
+    )
+
+    # Instance attribute types (lets mypy/mypyc compile the class natively)
+    api_key: str
+    api_secret: str
+    _api_secret_bytes: bytes
+    base_url: str
+    env_name: str
+    symbol: str
+    timeout: int
+    _session: requests.Session
+    _signed_session: requests.Session
+    _order_prefixes: Dict[str, str]
+    _lot_step: Optional[Decimal]
+    _time_ns: Callable[[], int]
+    _monotonic_ns: Callable[[], int]
+    _urlencode: Callable[..., str]
+    _from_ts: Callable[[float], datetime]
+    _time_offset_ms: int
+    _time_synced: bool
+    stats: ExecStats
+    telegram: TelegramNotifier
+    _ws_base: str
+    _ws_price: Optional[float]
+    _ws_price_ts: float
+    _ws_balances: Dict[str, Tuple[float, float]]
+    _ws_user_live: bool
+    _ws_await_update_ms: int
+    _ws_thread: Optional[threading.Thread]
+    _ws_stop: threading.Event
+
+    # Default order-size precision (overridden by /exchangeInfo LOT_SIZE)
+    _LOT_STEP = Decimal('0.000001')   # BTC quantity
+    _TICK_STEP = Decimal('0.01')      # USDT quote quantity
+
+    def __init__(self, use_testnet: bool = True) -> None:
         """
         Initialize Binance executor.
 
@@ -79,31 +253,86 @@ class BinanceExecutor:
         if not self.api_key or not self.api_secret:
             raise ValueError("Binance API credentials not found in .env file")
 
+        # Encode secret once (reused for every signature)
+        self._api_secret_bytes = self.api_secret.encode('utf-8')
+
         # Base URLs
         if use_testnet:
             self.base_url = "https://testnet.binance.vision/api/v3"
+            self._ws_base = "wss://testnet.binance.vision/ws"
             self.env_name = "TESTNET"
         else:
             self.base_url = "https://api.binance.com/api/v3"
+            self._ws_base = "wss://stream.binance.com:9443/ws"
             self.env_name = "PRODUCTION"
-            print("[WARNING] Using PRODUCTION Binance API - REAL MONEY AT RISK!")
+            log.warning("Using PRODUCTION Binance API - REAL MONEY AT RISK!")
 
         # Trading config
         self.symbol = "BTCUSDT"
         self.timeout = 10
 
-        # Statistics
-        self.stats = {
-            'orders_placed': 0,
-            'orders_failed': 0,
-            'buy_orders': 0,
-            'sell_orders': 0,
-            'total_volume_usd': 0.0
+        # Keep-alive sessions (connection pools are thread-safe for concurrent calls)
+        self._session = requests.Session()
+        self._session.headers.update({'X-MBX-APIKEY': self.api_key})
+        self._signed_session = requests.Session()
+        self._signed_session.headers.update({'X-MBX-APIKEY': self.api_key})
+
+        # Unsigned requests retry transient failures with exponential backoff
+        # (0.3s, 0.6s, 1.2s); status/read retries apply to GET/DELETE only.
+        # Signed requests get no urllib3 retries: a replay would resend the
+        # original timestamp, and a single failed attempt (up to the 10s
+        # timeout) can already outlast Binance's 5s recvWindow. Their only
+        # retry is the re-signed one after a -1021 error.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'DELETE'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session.mount('https://', HTTPAdapter(max_retries=retry))
+        self._signed_session.mount('https://', HTTPAdapter(max_retries=0))
+
+        # Static query-string prefixes for market orders (only the amount varies)
+        self._order_prefixes = {
+            side: f"symbol={self.symbol}&side={side}&type=MARKET&"
+            for side in ('BUY', 'SELL')
         }
 
+        # Exchange LOT_SIZE step, fetched once on first order
+        self._lot_step = None
+
+        # Pre-bound helpers for the per-request hot path
+        self._time_ns = time.time_ns
+        self._monotonic_ns = time.monotonic_ns
+        self._urlencode = urlencode
+        self._from_ts = datetime.fromtimestamp
+
+        # Request timestamps = monotonic clock + offset to server time.
+        # Anchored to wall clock until the first /time sync succeeds; the
+        # sync runs on the first signed request, so constructing an executor
+        # never waits on the network.
+        self._time_offset_ms = self._time_ns() // 1_000_000 - self._monotonic_ms()
+        self._time_synced = False
+
+        # Statistics
+        self.stats = ExecStats()
+
         # Telegram notifier
         self.telegram = TelegramNotifier()
 
+        # WebSocket stream state (populated by start_streams())
+        self._ws_price = None
+        self._ws_price_ts = 0.0
+        self._ws_balances = {}
+        self._ws_user_live = False
+        # Server time (ms) of our last order; streamed balances are stale
+        # until an account update at or after it arrives (0 = up to date)
+        self._ws_await_update_ms = 0
+        self._ws_thread = None
+        self._ws_stop = threading.Event()
+
     def _generate_signature(self, query_string: str) -> str:
         """
         Generate HMAC SHA256 signature for authenticated endpoints.
@@ -113,19 +342,132 @@ class BinanceExecutor:
 
         Returns:
             Hex-encoded signature
+
+        Note:
+            hmac.digest() is the one-shot C fast path (OpenSSL-backed),
+            avoiding the Python-level HMAC object built by hmac.new().
         """
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
+        return hmac.digest(
+            self._api_secret_bytes,
             query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+            'sha256'
+        ).hex()
+
+    def _monotonic_ms(self) -> int:
+        """Monotonic clock in milliseconds (immune to NTP step jumps)."""
+        return self._monotonic_ns() // 1_000_000
+
+    def _timestamp_ms(self) -> int:
+        """Current Binance server time estimate in milliseconds."""
+        return self._monotonic_ms() + self._time_offset_ms
+
+    def _signed_timestamp_ms(self) -> int:
+        """Timestamp for a signed request (syncs with /time on first use)."""
+        if not self._time_synced:
+            self._time_synced = True
+            self._sync_time()
+        return self._timestamp_ms()
+
+    def _sync_time(self) -> bool:
+        """
+        Sync request timestamps with Binance server time (GET /time).
+
+        Keeps the previous offset if the server cannot be reached.
+
+        Returns:
+            True if the offset was updated
+        """
+        try:
+            binance_limiter.consume_n(1)
+            local_before = self._monotonic_ms()
+            server_time = self._make_request('GET', '/time')['serverTime']
+            local_after = self._monotonic_ms()
+
+            # Assume server stamped the response halfway through the round trip
+            self._time_offset_ms = server_time - (local_before + local_after) // 2
+            return True
+        except Exception as e:
+            log.warning("Binance time sync failed, using local clock: %s", e)
+            return False
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Union[Dict, str]] = None,
+        stream_fills: bool = False,
+        signed: bool = False
+    ) -> Dict:
+        """
+        Send a prepared request and decode the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (e.g., '/account')
+            params: Query parameters (dict, or an already-encoded query string)
+            stream_fills: If True, stream-parse large order responses with
+                          ijson (see _stream_order_response)
+            signed: If True, send on the session without urllib3 retries
+                    (params carry a timestamp that a replay would reuse)
+
+        Returns:
+            API response as dict
+
+        Raises:
+            BinanceAPIError: If Binance returns an error payload
+            Exception: If the request fails for any other reason
+        """
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        url = f"{self.base_url}{endpoint}"
+
+        response = None
+        try:
+            stream = stream_fills and IJSON_AVAILABLE
+            session = self._signed_session if signed else self._session
+            response = session.request(
+                method, url, params=params, timeout=self.timeout, stream=stream
+            )
+
+            # Check for errors (inline check; raise_for_status() formats a message we discard)
+            if response.status_code >= 400:
+                raise requests.exceptions.HTTPError(
+                    f"HTTP {response.status_code} for {endpoint}", response=response
+                )
+
+            try:
+                if stream and _stream_worthwhile(response.headers):
+                    response.raw.decode_content = True
+                    return _stream_order_response(response.raw)
+                return _decode_json(response.content)
+            except ValueError as e:
+                raise Exception(f"Binance request failed: invalid JSON response ({e})")
+
+        except requests.exceptions.RequestException as e:
+            # Parse error message if available
+            error_data = None
+            if response is not None:
+                try:
+                    error_data = _decode_json(response.content)
+                except ValueError:
+                    pass
+
+            if not isinstance(error_data, dict):
+                raise Exception(f"Binance request failed: {e}")
+
+            raise BinanceAPIError(
+                error_data.get('code', 'N/A'),
+                error_data.get('msg', str(e))
+            )
 
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        signed: bool = False
+        signed: bool = False,
+        _resync: bool = True
     ) -> Dict:
         """
         Make authenticated request to Binance API.
@@ -135,6 +477,8 @@ class BinanceExecutor:
             endpoint: API endpoint (e.g., '/account')
             params: Query parameters
             signed: If True, add timestamp and signature
+            _resync: If True, re-sync server time and retry once on a
+                     -1021 (timestamp outside recvWindow) error
 
         Returns:
             API response as dict
@@ -142,49 +486,24 @@ class BinanceExecutor:
         Raises:
             Exception: If request fails
         """
-        # Build URL
-        url = f"{self.base_url}{endpoint}"
-
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
-
         # Add timestamp for signed requests
         if signed:
             if params is None:
                 params = {}
-            params['timestamp'] = int(time.time() * 1000)
+            params.pop('signature', None)
+            params['timestamp'] = self._signed_timestamp_ms()
 
             # Generate signature
-            query_string = urlencode(params)
+            query_string = self._urlencode(params)
             params['signature'] = self._generate_signature(query_string)
 
-        # Make request
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, params=params, timeout=self.timeout)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, params=params, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            # Check for errors
-            response.raise_for_status()
-
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            # Parse error message if available
-            try:
-                error_data = response.json()
-                error_msg = error_data.get('msg', str(e))
-                error_code = error_data.get('code', 'N/A')
-                raise Exception(f"Binance API error [{error_code}]: {error_msg}")
-            except:
-                raise Exception(f"Binance request failed: {e}")
+            return self._send(method, endpoint, params, signed=signed)
+        except BinanceAPIError as e:
+            # Clock drifted outside recvWindow: re-sync and retry once
+            if e.code == -1021 and signed and _resync and self._sync_time():
+                return self._make_request(method, endpoint, params, signed, _resync=False)
+            raise
 
     # 
     # ACCOUNT INFORMATION
@@ -206,11 +525,13 @@ class BinanceExecutor:
         """
         return self._make_request('GET', '/account', signed=True)
 
-    @binance_limiter.limit
     def get_balance(self, asset: str) -> Dict:
         """
         Get balance for a specific asset.
 
+        Served from the user-data stream when it is live and has caught up
+        with our last order, otherwise via REST.
+
         Args:
             asset: Asset symbol (e.g., 'BTC', 'USDT')
 
@@ -222,6 +543,20 @@ class BinanceExecutor:
                 'total': float (free + locked)
             }
         """
+        if self._ws_user_live and not self._ws_await_update_ms:
+            free, locked = self._ws_balances.get(asset, (0.0, 0.0))
+            return {
+                'asset': asset,
+                'free': free,
+                'locked': locked,
+                'total': free + locked
+            }
+
+        return self._rest_balance(asset)
+
+    @binance_limiter.limit
+    def _rest_balance(self, asset: str) -> Dict:
+        """Get balance for a specific asset from REST /account."""
         account_info = self.get_account_info()
 
         # Find asset in balances
@@ -279,14 +614,24 @@ class BinanceExecutor:
     # PRICE INFORMATION
     # 
 
-    @binance_limiter.limit
     def get_current_price(self) -> float:
         """
         Get current BTC/USDT price.
 
+        Served from the ticker stream when it is fresh, otherwise via REST.
+
         Returns:
             Current price as float
         """
+        price = self._ws_price
+        if price is not None and time.monotonic() - self._ws_price_ts < STREAM_PRICE_MAX_AGE:
+            return price
+
+        return self._rest_price_fallback()
+
+    @binance_limiter.limit
+    def _rest_price_fallback(self) -> float:
+        """Get current BTC/USDT price from REST /ticker/price."""
         response = self._make_request('GET', '/ticker/price', {'symbol': self.symbol})
         return float(response['price'])
 
@@ -294,6 +639,67 @@ class BinanceExecutor:
     # ORDER EXECUTION
     # 
 
+    def _get_lot_step(self) -> Decimal:
+        """
+        Get the symbol's LOT_SIZE step from /exchangeInfo (cached after first call).
+
+        Falls back to _LOT_STEP if exchange info cannot be fetched.
+
+        Returns:
+            Quantity step as Decimal (e.g., Decimal('0.00001'))
+        """
+        if self._lot_step is None:
+            try:
+                binance_limiter.consume_n(20)  # /exchangeInfo request weight
+                info = self._make_request('GET', '/exchangeInfo', {'symbol': self.symbol})
+                filters = info['symbols'][0]['filters']
+                step = next(f['stepSize'] for f in filters if f['filterType'] == 'LOT_SIZE')
+                self._lot_step = Decimal(step).normalize()
+            except Exception as e:
+                log.warning("Could not load LOT_SIZE filter, using default: %s", e)
+                self._lot_step = self._LOT_STEP
+        return self._lot_step
+
+    def _place_market_order_fast(self, side: str, qty_field: str, qty_str: str) -> Dict:
+        """
+        POST a market order from the precomputed query-string prefix.
+
+        Skips the generic dict + urlencode path in _make_request: only the
+        amount, timestamp and signature are formatted per order.
+
+        Args:
+            side: 'BUY' or 'SELL'
+            qty_field: 'quantity' or 'quoteOrderQty'
+            qty_str: Amount already formatted to the exchange step
+
+        Returns:
+            Raw order response as dict
+        """
+        prefix = self._order_prefixes[side]
+
+        def signed_query() -> str:
+            query_string = f"{prefix}{qty_field}={qty_str}&timestamp={self._signed_timestamp_ms()}"
+            return query_string + "&signature=" + self._generate_signature(query_string)
+
+        try:
+            return self._send('POST', '/order', signed_query(), stream_fills=True, signed=True)
+        except BinanceAPIError as e:
+            # Clock drifted outside recvWindow: re-sync and re-sign once
+            if not (e.code == -1021 and self._sync_time()):
+                raise
+
+        return self._send('POST', '/order', signed_query(), stream_fills=True, signed=True)
+
+    @staticmethod
+    def _format_amount(value: float, step: Decimal) -> str:
+        """
+        Round an order amount down to the exchange step size.
+
+        Uses Decimal(str(value)) so binary float noise (0.3 -> 0.29999...)
+        does not push the value below the intended step.
+        """
+        return str(Decimal(str(value)).quantize(step, rounding=ROUND_DOWN))
+
     @binance_limiter.limit
     def place_market_order(
         self,
@@ -342,36 +748,39 @@ class BinanceExecutor:
         if quantity is not None and quote_quantity is not None:
             raise ValueError("Provide only one of quantity or quote_quantity")
 
-        # Build order parameters
-        params = {
-            'symbol': self.symbol,
-            'side': side,
-            'type': 'MARKET'
-        }
-
         # Add quantity (base asset - BTC)
         if quantity is not None:
-            # Format to 6 decimal places (Binance requires proper precision)
-            params['quantity'] = f"{quantity:.6f}"
+            # Round down to the LOT_SIZE step (Binance rejects extra precision)
+            qty_field = 'quantity'
+            qty_str = self._format_amount(quantity, self._get_lot_step())
 
         # Add quote quantity (quote asset - USDT) - only for BUY
         if quote_quantity is not None:
             if side != 'BUY':
                 raise ValueError("quoteOrderQty only supported for BUY orders")
-            params['quoteOrderQty'] = f"{quote_quantity:.2f}"
+            qty_field = 'quoteOrderQty'
+            qty_str = self._format_amount(quote_quantity, self._TICK_STEP)
 
         try:
-            # Place order
-            response = self._make_request('POST', '/order', params=params, signed=True)
+            # Streamed balances are pre-fill until the account update for
+            # this order arrives; get_balance() uses REST until then
+            self._ws_await_update_ms = self._timestamp_ms()
+
+            # Place order (symbol/side/type prefix is precomputed)
+            response = self._place_market_order_fast(side, qty_field, qty_str)
+            self._ws_await_update_ms = response.get('transactTime', self._ws_await_update_ms)
 
             # Parse response
             executed_qty = float(response.get('executedQty', 0))
 
             # Calculate average executed price
             fills = response.get('fills', [])
-            if fills:
-                total_qty = sum(float(fill['qty']) for fill in fills)
-                total_value = sum(float(fill['price']) * float(fill['qty']) for fill in fills)
+            if '_fills_totals' in response:
+                # Already summed while stream-parsing
+                total_qty, total_value = response['_fills_totals']
+                avg_price = total_value / total_qty if total_qty > 0 else 0
+            elif fills:
+                total_qty, total_value = self._aggregate_fills(fills)
                 avg_price = total_value / total_qty if total_qty > 0 else 0
             else:
                 avg_price = 0
@@ -379,12 +788,13 @@ class BinanceExecutor:
             executed_value = executed_qty * avg_price
 
             # Update statistics
-            self.stats['orders_placed'] += 1
+            stats = self.stats
+            stats.orders_placed += 1
             if side == 'BUY':
-                self.stats['buy_orders'] += 1
+                stats.buy_orders += 1
             else:
-                self.stats['sell_orders'] += 1
-            self.stats['total_volume_usd'] += executed_value
+                stats.sell_orders += 1
+            stats.total_volume_usd += executed_value
 
             return {
                 'order_id': response['orderId'],
@@ -395,13 +805,40 @@ class BinanceExecutor:
                 'executed_qty': executed_qty,
                 'executed_price': avg_price,
                 'executed_value': executed_value,
-                'timestamp': datetime.fromtimestamp(response['transactTime'] / 1000)
+                'timestamp': self._from_ts(response['transactTime'] / 1000)
             }
 
         except Exception as e:
-            self.stats['orders_failed'] += 1
+            self.stats.orders_failed += 1
             raise Exception(f"Order placement failed: {e}")
 
+    @staticmethod
+    def _aggregate_fills(fills: List[Dict]) -> Tuple[float, float]:
+        """
+        Sum executed quantity and value across order fills.
+
+        Args:
+            fills: 'fills' list from the order response
+
+        Returns:
+            (total_qty, total_value)
+        """
+        # Small fills lists are cheaper in plain Python than NumPy setup
+        if len(fills) <= 4:
+            total_qty = 0.0
+            total_value = 0.0
+            for fill in fills:
+                qty = float(fill['qty'])
+                total_qty += qty
+                total_value += float(fill['price']) * qty
+            return total_qty, total_value
+
+        arr = np.array(
+            [(float(fill['price']), float(fill['qty'])) for fill in fills],
+            dtype=np.float64
+        )
+        return float(arr[:, 1].sum()), float(np.dot(arr[:, 0], arr[:, 1]))
+
     def execute_signal(self, signal: Dict, current_price: float) -> Optional[Dict]:
         """
         Execute a trading signal from the Decision Box.
@@ -426,50 +863,50 @@ class BinanceExecutor:
         reason = signal.get('reason', 'N/A')
         strategy = signal.get('strategy', 'Unknown')
 
-        print(f"\n[SIGNAL] {action} | {strategy} | {reason}")
+        log.info("\n[SIGNAL] %s | %s | %s", action, strategy, reason)
 
         # Handle different actions
         if action == 'BUY':
             # Buy with USD amount
-            print(f"[EXECUTE] Buying ${amount:.2f} worth of BTC at ${current_price:,.2f}")
+            log.info("[EXECUTE] Buying $%.2f worth of BTC at $%s", amount, format(current_price, ',.2f'))
             try:
                 result = self.place_market_order('BUY', quote_quantity=amount)
-                print(f"[SUCCESS] Bought {result['executed_qty']:.6f} BTC @ ${result['executed_price']:,.2f}")
+                log.info("[SUCCESS] Bought %.6f BTC @ $%s", result['executed_qty'], format(result['executed_price'], ',.2f'))
 
                 # Send Telegram notification
                 self.telegram.notify_trade(signal, current_price)
 
                 return result
             except Exception as e:
-                print(f"[ERROR] Order failed: {e}")
+                log.error("Order failed: %s", e)
                 return None
 
         elif action == 'SELL':
             # Sell all BTC
             btc_balance = self.get_balance('BTC')
             if btc_balance['free'] > 0:
-                print(f"[EXECUTE] Selling {btc_balance['free']:.6f} BTC at ${current_price:,.2f}")
+                log.info("[EXECUTE] Selling %.6f BTC at $%s", btc_balance['free'], format(current_price, ',.2f'))
                 try:
                     result = self.place_market_order('SELL', quantity=btc_balance['free'])
-                    print(f"[SUCCESS] Sold {result['executed_qty']:.6f} BTC @ ${result['executed_price']:,.2f}")
+                    log.info("[SUCCESS] Sold %.6f BTC @ $%s", result['executed_qty'], format(result['executed_price'], ',.2f'))
 
                     # Send Telegram notification
                     self.telegram.notify_trade(signal, current_price)
 
                     return result
                 except Exception as e:
-                    print(f"[ERROR] Order failed: {e}")
+                    log.error("Order failed: %s", e)
                     return None
             else:
-                print(f"[SKIP] No BTC to sell (balance: {btc_balance['free']:.6f})")
+                log.info("[SKIP] No BTC to sell (balance: %.6f)", btc_balance['free'])
                 return None
 
         elif action == 'HOLD':
-            print(f"[HOLD] No action taken")
+            log.info("[HOLD] No action taken")
             return None
 
         elif action == 'PAUSE':
-            print(f"[PAUSE] Trading paused: {reason}")
+            log.info("[PAUSE] Trading paused: %s", reason)
 
             # Send Telegram notification for circuit breaker
             self.telegram.notify_trade(signal, current_price)
@@ -477,9 +914,119 @@ class BinanceExecutor:
             return None
 
         else:
-            print(f"[WARNING] Unknown action: {action}")
+            log.warning("Unknown action: %s", action)
             return None
 
+    # 
+    # WEBSOCKET STREAMS
+    # 
+
+    def start_streams(self) -> bool:
+        """
+        Start background ticker + user-data WebSocket streams.
+
+        Once connected, get_current_price() and get_balance() read the
+        last pushed values instead of polling REST. REST stays the fallback
+        while streams are connecting, stale, or disconnected.
+
+        Returns:
+            True if streams were started (requires the 'websockets' package)
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            log.warning("websockets not installed - using REST polling")
+            return False
+
+        if self._ws_thread is not None and self._ws_thread.is_alive():
+            return True
+
+        self._ws_stop.clear()
+        self._ws_thread = threading.Thread(
+            target=lambda: asyncio.run(self._run_streams()),
+            name='binance-streams',
+            daemon=True
+        )
+        self._ws_thread.start()
+        return True
+
+    def stop_streams(self) -> None:
+        """Stop background streams and fall back to REST."""
+        self._ws_stop.set()
+        if self._ws_thread is not None:
+            self._ws_thread.join(timeout=5)
+            self._ws_thread = None
+        self._ws_user_live = False
+        self._ws_price = None
+
+    async def _run_streams(self) -> None:
+        """Run both streams until stop_streams() is called."""
+        await asyncio.gather(self._price_stream(), self._user_data_stream())
+
+    async def _recv(self, ws: Any) -> Optional[Dict]:
+        """Receive one message, or None after 1s so the stop flag is re-checked."""
+        try:
+            return _decode_json(await asyncio.wait_for(ws.recv(), timeout=1.0))
+        except asyncio.TimeoutError:
+            return None
+
+    async def _price_stream(self) -> None:
+        """Keep _ws_price updated from the <symbol>@ticker stream."""
+        url = f"{self._ws_base}/{self.symbol.lower()}@ticker"
+
+        while not self._ws_stop.is_set():
+            try:
+                async with websockets.connect(url) as ws:
+                    while not self._ws_stop.is_set():
+                        data = await self._recv(ws)
+                        if data is not None and 'c' in data:
+                            self._ws_price = float(data['c'])  # Last price
+                            self._ws_price_ts = time.monotonic()
+            except Exception as e:
+                log.warning("Price stream disconnected: %s", e)
+                await asyncio.sleep(5)
+
+    async def _user_data_stream(self) -> None:
+        """Keep _ws_balances updated from the account user-data stream."""
+        while not self._ws_stop.is_set():
+            try:
+                response = await asyncio.to_thread(self._send, 'POST', '/userDataStream')
+                listen_key = response['listenKey']
+
+                # Warm start: seed balances from REST, then apply pushed deltas
+                binance_limiter.consume_n(20)  # /account request weight
+                account = await asyncio.to_thread(self._make_request, 'GET', '/account', None, True)
+                self._ws_balances = {
+                    b['asset']: (float(b['free']), float(b['locked']))
+                    for b in account['balances']
+                }
+
+                async with websockets.connect(f"{self._ws_base}/{listen_key}") as ws:
+                    self._ws_user_live = True
+                    last_keepalive = time.monotonic()
+
+                    while not self._ws_stop.is_set():
+                        if time.monotonic() - last_keepalive > LISTEN_KEY_KEEPALIVE:
+                            await asyncio.to_thread(
+                                self._send, 'PUT', '/userDataStream', {'listenKey': listen_key}
+                            )
+                            last_keepalive = time.monotonic()
+
+                        event = await self._recv(ws)
+                        if event is not None and event.get('e') == 'outboundAccountPosition':
+                            self._apply_account_event(event)
+            except Exception as e:
+                log.warning("User-data stream disconnected: %s", e)
+                await asyncio.sleep(5)
+            finally:
+                self._ws_user_live = False
+
+    def _apply_account_event(self, event: Dict) -> None:
+        """Apply an outboundAccountPosition event to the streamed balances."""
+        for b in event['B']:
+            self._ws_balances[b['a']] = (float(b['f']), float(b['l']))
+        # 'u' = time of the account update this event reflects
+        if event.get('u', 0) >= self._ws_await_update_ms:
+            self._ws_await_update_ms = 0
+
     # 
     # STATISTICS
     # 
@@ -491,59 +1038,59 @@ class BinanceExecutor:
         Returns:
             dict with order stats
         """
-        return self.stats.copy()
+        return asdict(self.stats)
 
-    def reset_stats(self):
+    def reset_stats(self) -> None:
         """Reset statistics counters."""
-        self.stats = {
-            'orders_placed': 0,
-            'orders_failed': 0,
-            'buy_orders': 0,
-            'sell_orders': 0,
-            'total_volume_usd': 0.0
-        }
+        self.stats = ExecStats()
 
 
-def main():
+def main() -> None:
     """Test Binance executor functionality."""
-    print("="*60)
-    print(f"BINANCE EXECUTOR - Testing")
-    print("="*60)
+    listener = start_queue_logging()
+
+    log.info("="*60)
+    log.info("BINANCE EXECUTOR - Testing")
+    log.info("="*60)
 
     try:
         executor = BinanceExecutor(use_testnet=True)
-        print(f"\n[OK] Connected to Binance {executor.env_name}")
+        log.info("\n[OK] Connected to Binance %s", executor.env_name)
+
+        # Account and price are independent - fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            f_account = pool.submit(executor.get_account_info)
+            f_price = pool.submit(executor.get_current_price)
+            account, price = f_account.result(), f_price.result()
 
         # Test 1: Get account info
-        print("\nTest 1: Account Information")
-        account = executor.get_account_info()
-        print(f"   Can Trade: {account['canTrade']}")
-        print(f"   Can Withdraw: {account['canWithdraw']}")
-        print(f"   Can Deposit: {account['canDeposit']}")
+        log.info("\nTest 1: Account Information")
+        log.info("   Can Trade: %s", account['canTrade'])
+        log.info("   Can Withdraw: %s", account['canWithdraw'])
+        log.info("   Can Deposit: %s", account['canDeposit'])
 
         # Test 2: Get balances
-        print("\nTest 2: Account Balances")
+        log.info("\nTest 2: Account Balances")
         btc_balance = executor.get_balance('BTC')
         usdt_balance = executor.get_balance('USDT')
-        print(f"   BTC: {btc_balance['free']:.6f} (locked: {btc_balance['locked']:.6f})")
-        print(f"   USDT: {usdt_balance['free']:.2f} (locked: {usdt_balance['locked']:.2f})")
+        log.info("   BTC: %.6f (locked: %.6f)", btc_balance['free'], btc_balance['locked'])
+        log.info("   USDT: %.2f (locked: %.2f)", usdt_balance['free'], usdt_balance['locked'])
 
         # Test 3: Get current price
-        print("\nTest 3: Current BTC Price")
-        price = executor.get_current_price()
-        print(f"   BTC/USDT: ${price:,.2f}")
+        log.info("\nTest 3: Current BTC Price")
+        log.info("   BTC/USDT: $%s", format(price, ',.2f'))
 
         # Test 4: Portfolio value
-        print("\nTest 4: Portfolio Value")
+        log.info("\nTest 4: Portfolio Value")
         portfolio = executor.get_portfolio_value(price)
-        print(f"   BTC Balance: {portfolio['btc_balance']:.6f} BTC")
-        print(f"   USDT Balance: ${portfolio['usdt_balance']:.2f}")
-        print(f"   BTC Value: ${portfolio['btc_value_usd']:,.2f}")
-        print(f"   Total Value: ${portfolio['total_value_usd']:,.2f}")
+        log.info("   BTC Balance: %.6f BTC", portfolio['btc_balance'])
+        log.info("   USDT Balance: $%.2f", portfolio['usdt_balance'])
+        log.info("   BTC Value: $%s", format(portfolio['btc_value_usd'], ',.2f'))
+        log.info("   Total Value: $%s", format(portfolio['total_value_usd'], ',.2f'))
 
         # Test 5: Test signal execution (DRY RUN - commented out to avoid real orders)
-        print("\nTest 5: Signal Execution (DRY RUN)")
-        print("   [SKIP] Uncomment test_signal section in code to test order placement")
+        log.info("\nTest 5: Signal Execution (DRY RUN)")
+        log.info("   [SKIP] Uncomment test_signal section in code to test order placement")
 
         # Uncomment to test actual order placement:
         # test_signal = {
@@ -554,25 +1101,28 @@ def main():
         # }
         # result = executor.execute_signal(test_signal, price)
         # if result:
-        #     print(f"   Order ID: {result['order_id']}")
-        #     print(f"   Executed: {result['executed_qty']:.6f} BTC @ ${result['executed_price']:,.2f}")
+        #     log.info("   Order ID: %s", result['order_id'])
+        #     log.info("   Executed: %.6f BTC @ $%.2f", result['executed_qty'], result['executed_price'])
 
         # Test 6: Statistics
-        print("\nTest 6: Executor Statistics")
+        log.info("\nTest 6: Executor Statistics")
         stats = executor.get_stats()
-        print(f"   Orders Placed: {stats['orders_placed']}")
-        print(f"   Orders Failed: {stats['orders_failed']}")
-        print(f"   Buy Orders: {stats['buy_orders']}")
-        print(f"   Sell Orders: {stats['sell_orders']}")
-        print(f"   Total Volume: ${stats['total_volume_usd']:,.2f}")
+        log.info("   Orders Placed: %s", stats['orders_placed'])
+        log.info("   Orders Failed: %s", stats['orders_failed'])
+        log.info("   Buy Orders: %s", stats['buy_orders'])
+        log.info("   Sell Orders: %s", stats['sell_orders'])
+        log.info("   Total Volume: $%s", format(stats['total_volume_usd'], ',.2f'))
 
-        print("\n" + "="*60)
-        print("[COMPLETE] BINANCE EXECUTOR TEST PASSED")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("[COMPLETE] BINANCE EXECUTOR TEST PASSED")
+        log.info("="*60)
 
     except Exception as e:
-        print(f"\n[ERROR] Test failed: {e}")
-        print("="*60)
+        log.error("\nTest failed: %s", e)
+        log.info("="*60)
+
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
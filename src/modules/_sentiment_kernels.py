@@ -0,0 +1,72 @@
+"""
+Numba kernels for Module 2 (sentiment / RAG).
+
+The RAG feature normalization is a fixed per-row transform, so it runs as a
+single parallel loop over rows instead of a chain of NumPy column passes
+(one temporary per step). Numba is optional: without it the decorator is a
+no-op and callers should use their NumPy path instead (check
+NUMBA_AVAILABLE), since the loop is slow as plain Python.
+"""
+
+# Optional: Numba JIT (parallel over rows)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels still run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# Rows per parallel work item in normalize_features
+_ROW_BLOCK = 1024
+
+
+@njit(parallel=True, cache=True)
+def normalize_features(raw, scale, lo, hi, price_min, price_max, out):
+    """
+    Normalize an (N, 12) block of RAG features into `out`, row-parallel.
+
+    Column 1 (ATR) becomes ATR as % of price, column 11 (Price) is min-max
+    scaled to 0-100 with price_min/price_max, and every other column j is
+    raw * scale[j] clipped to [lo[j], hi[j]] (same as _scale_features in
+    module2_sentiment).
+
+    Args:
+        raw: (N, 12) float array in RAG feature order (ATR and Price raw)
+        scale, lo, hi: (12,) per-column multiplier and clip bounds
+        price_min, price_max: Price range mapped to 0-100
+        out: (N, 12) output array (typically float32, C order); may be
+             raw itself, since Price (column 11) is overwritten last
+
+    Returns:
+        out
+    """
+    n = raw.shape[0]
+    m = raw.shape[1]
+    price_span = price_max - price_min
+    # Rows are processed in blocks, column by column inside each block, so
+    # both C-order and F-order (pandas .to_numpy()) inputs are read with
+    # short strides and the block of `out` stays in cache
+    n_blocks = (n + _ROW_BLOCK - 1) // _ROW_BLOCK
+    for b in prange(n_blocks):
+        start = b * _ROW_BLOCK
+        stop = min(start + _ROW_BLOCK, n)
+        for j in range(m):
+            s = scale[j]
+            l = lo[j]
+            h = hi[j]
+            for i in range(start, stop):
+                if j == 1:
+                    v = raw[i, 1] / raw[i, 11] * 100.0
+                elif j == 11:
+                    v = (raw[i, 11] - price_min) / price_span * 100.0
+                else:
+                    v = raw[i, j] * s
+                out[i, j] = min(max(v, l), h)
+    return out
@@ -42,32 +42,284 @@ VALIDATION METHOD:
 
 import sys
 import io
+import logging
+from collections import OrderedDict, deque
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Fix Windows console encoding for emojis
-if sys.platform == 'win32':
-    try:
-        if hasattr(sys.stdout, 'buffer') and not hasattr(sys.stdout, '_wrapped_utf8'):
-            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-            sys.stdout._wrapped_utf8 = True
-        if hasattr(sys.stderr, 'buffer') and not hasattr(sys.stderr, '_wrapped_utf8'):
-            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-            sys.stderr._wrapped_utf8 = True
-    except (AttributeError, ValueError, OSError):
-        pass  # Already wrapped or not available
-
 import pandas as pd
 import numpy as np
 from ta.momentum import RSIIndicator
 from ta.volatility import AverageTrueRange
-from ta.trend import MACD
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.utils.hashing import frame_digest
+
+log = logging.getLogger(__name__)
+
+# Optional: TA-Lib C bindings (much faster than the pandas-based `ta` package)
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# Optional: Numba JIT for the fused single-pass indicator kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels still run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# Optional: bottleneck C moving-window functions (SMA fallback path)
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+
+# 
+# FUSED INDICATOR KERNEL
+# 
+# Reproduces the `ta` package's RSI/ATR/MACD and pandas rolling SMA
+# semantics exactly, but in one pass over the price arrays.
+# No fastmath: the NaN checks (x == x) must not be optimized away.
+# 
+
+@njit(cache=True)
+def _ewm_step(weighted, old_wt, cur, alpha):
+    """One step of pandas ewm(alpha, adjust=False) (ignore_na=False)."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True)
+def _compute_indicators_numba(price, high, low):
+    """
+    Compute RSI(14), ATR(14), MACD(12, 26, 9), SMA_50, SMA_200 in one loop.
+
+    Inputs may be float32 or float64; all running state is kept in float64
+    and only the stored outputs use the input dtype.
+
+    Returns:
+        Tuple of 7 arrays (input dtype): rsi, atr, macd, macd_signal,
+        macd_diff, sma_50, sma_200
+    """
+    n = price.shape[0]
+    nan = np.nan
+    dt = price.dtype
+
+    rsi = np.empty(n, dt)
+    atr = np.zeros(n, dt)  # `ta` leaves the ATR warmup at 0, not NaN
+    macd = np.empty(n, dt)
+    macd_signal = np.empty(n, dt)
+    macd_diff = np.empty(n, dt)
+    sma_50 = np.empty(n, dt)
+    sma_200 = np.empty(n, dt)
+
+    a_rsi = 1.0 / 14.0
+    a_fast = 2.0 / 13.0
+    a_slow = 2.0 / 27.0
+    a_sign = 2.0 / 10.0
+
+    # EMA states: (weighted value, old weight, observation count)
+    up_w, up_ow = nan, 1.0
+    dn_w, dn_ow = nan, 1.0
+    fast_w, fast_ow, fast_n = nan, 1.0, 0
+    slow_w, slow_ow, slow_n = nan, 1.0, 0
+    sign_w, sign_ow, sign_n = nan, 1.0, 0
+    rsi_n = 0
+
+    tr_sum = 0.0
+    tr_count = 0
+    atr_prev = 0.0
+
+    # Rolling sums (Kahan-compensated like pandas) and non-NaN counts
+    s50, c50, n50 = 0.0, 0.0, 0
+    s200, c200, n200 = 0.0, 0.0, 0
+
+    for i in range(n):
+        p = np.float64(price[i])
+
+        # RSI: gains/losses smoothed with alpha = 1/14
+        if i == 0:
+            up = 0.0
+            dn = 0.0
+        else:
+            d = p - np.float64(price[i - 1])
+            up = d if d > 0 else 0.0
+            dn = -d if d < 0 else 0.0
+        up_w, up_ow = _ewm_step(up_w, up_ow, up, a_rsi)
+        dn_w, dn_ow = _ewm_step(dn_w, dn_ow, dn, a_rsi)
+        rsi_n += 1
+        if rsi_n < 14:
+            rsi[i] = nan
+        elif dn_w == 0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + up_w / dn_w)
+
+        # ATR: true range (NaN-skipping max), SMA seed, then Wilder smoothing
+        hi = np.float64(high[i])
+        lo = np.float64(low[i])
+        tr = hi - lo
+        if i > 0:
+            pc = np.float64(price[i - 1])
+            for v in (abs(hi - pc), abs(lo - pc)):
+                if v == v and (tr != tr or v > tr):
+                    tr = v
+        if i < 14:
+            if tr == tr:
+                tr_sum += tr
+                tr_count += 1
+            if i == 13:
+                atr_prev = tr_sum / tr_count if tr_count > 0 else nan
+                atr[i] = atr_prev
+        else:
+            atr_prev = (atr_prev * 13.0 + tr) / 14.0
+            atr[i] = atr_prev
+
+        # MACD: EMA(12) - EMA(26), signal = EMA(9) of MACD
+        fast_w, fast_ow = _ewm_step(fast_w, fast_ow, p, a_fast)
+        slow_w, slow_ow = _ewm_step(slow_w, slow_ow, p, a_slow)
+        if p == p:
+            fast_n += 1
+            slow_n += 1
+        m = fast_w - slow_w if (fast_n >= 12 and slow_n >= 26) else nan
+        macd[i] = m
+
+        sign_w, sign_ow = _ewm_step(sign_w, sign_ow, m, a_sign)
+        if m == m:
+            sign_n += 1
+        sig = sign_w if sign_n >= 9 else nan
+        macd_signal[i] = sig
+        macd_diff[i] = m - sig
+
+        # SMA_50 / SMA_200: add new price, drop the one leaving the window
+        if p == p:
+            y = p - c50
+            t = s50 + y
+            c50 = (t - s50) - y
+            s50 = t
+            n50 += 1
+            y = p - c200
+            t = s200 + y
+            c200 = (t - s200) - y
+            s200 = t
+            n200 += 1
+        if i >= 50:
+            old = np.float64(price[i - 50])
+            if old == old:
+                y = -old - c50
+                t = s50 + y
+                c50 = (t - s50) - y
+                s50 = t
+                n50 -= 1
+        if i >= 200:
+            old = np.float64(price[i - 200])
+            if old == old:
+                y = -old - c200
+                t = s200 + y
+                c200 = (t - s200) - y
+                s200 = t
+                n200 -= 1
+        sma_50[i] = s50 / n50 if (i >= 49 and n50 >= 50) else nan
+        sma_200[i] = s200 / n200 if (i >= 199 and n200 >= 200) else nan
+
+    return rsi, atr, macd, macd_signal, macd_diff, sma_50, sma_200
+
+
+def _moving_mean(price: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average with pandas rolling(window).mean() semantics.
+
+    Uses bottleneck.move_mean when installed, otherwise a cumulative-sum
+    difference (NaNs counted separately so any NaN in the window gives NaN).
+
+    Args:
+        price: float64 price array
+        window: Window length
+
+    Returns:
+        float64 array, NaN for the first window-1 entries
+    """
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_mean(price, window, min_count=window)
+
+    valid = ~np.isnan(price)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, price, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+
+    out = np.full(price.shape[0], np.nan)
+    sums = csum[window:] - csum[:-window]
+    counts = ccount[window:] - ccount[:-window]
+    out[window - 1:] = np.where(counts == window, sums / window, np.nan)
+    return out
+
+
+def _ema(series: pd.Series, span: int) -> pd.Series:
+    """
+    EMA recurrence ema[i] = a*x[i] + (1-a)*ema[i-1], a = 2/(span+1).
+
+    Matches `ta`'s MACD EMAs (adjust=False, NaN until `span` observations).
+    """
+    return series.ewm(span=span, min_periods=span, adjust=False).mean()
+
 
+INDICATOR_COLUMNS = ('RSI', 'ATR', 'MACD', 'MACD_signal', 'MACD_diff', 'SMA_50', 'SMA_200')
 
-def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
+DateLike = Union[str, pd.Timestamp, np.datetime64]
+
+
+def _to_ts(date: DateLike) -> pd.Timestamp:
+    """Convert to pd.Timestamp, skipping the parse when it already is one."""
+    return date if isinstance(date, pd.Timestamp) else pd.Timestamp(date)
+
+
+def _dates_array(df: pd.DataFrame):
+    """
+    Return df's Date column as a datetime64[ns] array and whether it is sorted.
+
+    Read fresh on every call (a zero-copy view for datetime64[ns] columns), so
+    a reassigned or edited Date column is always seen.
+
+    Args:
+        df: DataFrame with a Date column
+
+    Returns:
+        Tuple (dates, is_sorted); dates is None when Date is not a naive
+        datetime64 column (callers then fall back to boolean masks)
+    """
+    col = df['Date']
+    if not np.issubdtype(col.dtype, np.datetime64):
+        return None, False
+
+    dates = col.to_numpy().astype('datetime64[ns]', copy=False)
+    return dates, bool(col.is_monotonic_increasing)
+
+
+def calculate_indicators(
+    df: pd.DataFrame,
+    current_date: DateLike,
+    dtype=np.float64,
+    sma_min_periods: Optional[int] = None
+) -> pd.DataFrame:
     """
     Calculate all technical indicators up to current_date.
 
@@ -77,7 +329,13 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
 
     Args:
         df: DataFrame with columns ['Date', 'Price', 'High', 'Low', 'Volume']
-        current_date: Calculate indicators up to this date (YYYY-MM-DD)
+        current_date: Calculate indicators up to this date (YYYY-MM-DD string,
+                      pd.Timestamp or np.datetime64)
+        dtype: Indicator column dtype. np.float32 halves memory traffic;
+               running sums/averages are still accumulated in float64.
+        sma_min_periods: If set, the SMA_50/SMA_200 warmup rows hold
+               partial-window means once this many prices are available
+               (like rolling(window, min_periods=...)) instead of NaN.
 
     Returns:
         DataFrame with added indicator columns:
@@ -95,14 +353,23 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
         df_with_indicators = calculate_indicators(df, '2024-11-10')
     """
     # Convert current_date to timestamp for comparison
-    current_date = pd.Timestamp(current_date)
+    current_date = _to_ts(current_date)
 
     # Filter data up to current_date (ANTI-FUTURE-DATA)
     # Add 1 second buffer to avoid filtering out current data due to timestamp precision
-    df_past = df[df['Date'] <= current_date + pd.Timedelta(seconds=1)].copy()
+    cutoff = current_date + pd.Timedelta(seconds=1)
+    dates, dates_sorted = _dates_array(df)
+    if dates_sorted:
+        # Sorted (normal case): binary search + positional slice, no mask or copy
+        end = np.searchsorted(dates, cutoff.to_datetime64(), side='right')
+        df_past = df.iloc[:end]
+    else:
+        df_past = df[df['Date'] <= cutoff]
 
     if len(df_past) < 200:
-        print(f"[WARNING]  Warning: Only {len(df_past)} rows available (need 200+ for all indicators)")
+        # DEBUG, not a print: short histories are routine (live warmup, early
+        # backtest days) and this runs on every call
+        log.debug("Only %d rows available (need 200+ for all indicators)", len(df_past))
 
     # Ensure required columns exist
     required_cols = ['Date', 'Price']
@@ -110,6 +377,39 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
+    # High/Low are optional: when absent, Price is used as the proxy without
+    # materializing copies (True Range then reduces to |Price - PrevPrice|)
+
+    # Every backend returns a new frame built by _with_indicators(),
+    # so df_past stays a view of df and is never written to
+    if NUMBA_AVAILABLE:
+        df_with_ind = _calculate_indicators_numba(df_past, dtype)
+    elif TALIB_AVAILABLE:
+        df_with_ind = _calculate_indicators_talib(df_past, dtype)
+    else:
+        df_with_ind = _calculate_indicators_ta(df_past, dtype)
+
+    if sma_min_periods is not None:
+        _fill_partial_sma(df_with_ind, df_past['Price'].to_numpy(dtype=np.float64), sma_min_periods)
+
+    return df_with_ind
+
+
+def _calculate_indicators_ta(df_past: pd.DataFrame, dtype=np.float64) -> pd.DataFrame:
+    """
+    Compute all indicators with the pandas-based `ta` package (reference path).
+
+    Args:
+        df_past: Date-filtered DataFrame with Price (and optionally High, Low)
+        dtype: Output dtype
+
+    Returns:
+        df_past with indicator columns added
+    """
+    n = len(df_past)
+    nan = np.full(n, np.nan)
+    outputs = {}
+
     # 
     # INDICATOR 1: RSI (Relative Strength Index)
     # 
@@ -117,11 +417,11 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
     # Calculation: RSI = 100 - [100 / (1 + RS)]
     #              where RS = Average Gain / Average Loss over 14 periods
     # 
-    if len(df_past) >= 14:
+    if n >= 14:
         rsi_indicator = RSIIndicator(close=df_past['Price'], window=14)
-        df_past['RSI'] = rsi_indicator.rsi()
+        outputs['RSI'] = rsi_indicator.rsi().to_numpy()
     else:
-        df_past['RSI'] = np.nan
+        outputs['RSI'] = nan
 
     # 
     # INDICATOR 2: ATR (Average True Range)
@@ -130,22 +430,16 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
     # Calculation: ATR = Average of True Range over 14 periods
     #              True Range = max(High-Low, |High-PrevClose|, |Low-PrevClose|)
     # 
-    # Need High, Low columns - if not available, use Price as proxy
-    if 'High' not in df_past.columns:
-        df_past['High'] = df_past['Price']
-    if 'Low' not in df_past.columns:
-        df_past['Low'] = df_past['Price']
-
-    if len(df_past) >= 14:
+    if n >= 14:
         atr_indicator = AverageTrueRange(
-            high=df_past['High'],
-            low=df_past['Low'],
+            high=df_past['High'] if 'High' in df_past.columns else df_past['Price'],
+            low=df_past['Low'] if 'Low' in df_past.columns else df_past['Price'],
             close=df_past['Price'],
             window=14
         )
-        df_past['ATR'] = atr_indicator.average_true_range()
+        outputs['ATR'] = atr_indicator.average_true_range().to_numpy()
     else:
-        df_past['ATR'] = np.nan
+        outputs['ATR'] = nan
 
     # 
     # INDICATOR 3: MACD (Moving Average Convergence Divergence)
@@ -156,20 +450,22 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
     #   - Signal = EMA(9) of MACD
     #   - Histogram = MACD - Signal
     # 
-    if len(df_past) >= 26:
-        macd_indicator = MACD(
-            close=df_past['Price'],
-            window_fast=12,
-            window_slow=26,
-            window_sign=9
-        )
-        df_past['MACD'] = macd_indicator.macd()
-        df_past['MACD_signal'] = macd_indicator.macd_signal()
-        df_past['MACD_diff'] = macd_indicator.macd_diff()  # Histogram
+    if n >= 26:
+        # Same EMA recurrences as ta.trend.MACD, without the wrapper objects.
+        # Differences go straight into preallocated arrays (no Series
+        # arithmetic/alignment; EMA results may be read-only under CoW)
+        macd = np.empty(n)
+        macd_diff = np.empty(n)
+        np.subtract(_ema(df_past['Price'], 12).to_numpy(), _ema(df_past['Price'], 26).to_numpy(), out=macd)
+        macd_signal = _ema(pd.Series(macd), 9).to_numpy()
+        np.subtract(macd, macd_signal, out=macd_diff)  # Histogram
+        outputs['MACD'] = macd
+        outputs['MACD_signal'] = macd_signal
+        outputs['MACD_diff'] = macd_diff
     else:
-        df_past['MACD'] = np.nan
-        df_past['MACD_signal'] = np.nan
-        df_past['MACD_diff'] = np.nan
+        outputs['MACD'] = nan
+        outputs['MACD_signal'] = nan
+        outputs['MACD_diff'] = nan
 
     # 
     # INDICATOR 4: Moving Averages (SMA)
@@ -180,26 +476,217 @@ def calculate_indicators(df: pd.DataFrame, current_date: str) -> pd.DataFrame:
     # Golden Cross: SMA_50 crosses above SMA_200 (bullish)
     # Death Cross: SMA_50 crosses below SMA_200 (bearish)
     # 
-    if len(df_past) >= 50:
-        df_past['SMA_50'] = df_past['Price'].rolling(window=50).mean()
+    price = df_past['Price'].to_numpy(dtype=np.float64)
+
+    if n >= 50:
+        outputs['SMA_50'] = _moving_mean(price, 50)
     else:
-        df_past['SMA_50'] = np.nan
+        outputs['SMA_50'] = nan
+
+    if n >= 200:
+        outputs['SMA_200'] = _moving_mean(price, 200)
+    else:
+        outputs['SMA_200'] = nan
+
+    return _with_indicators(df_past, outputs, dtype)
+
+
+def _fill_partial_sma(df_with_ind: pd.DataFrame, price: np.ndarray, min_periods: int):
+    """
+    Fill NaN SMA_50/SMA_200 rows with partial-window means.
+
+    Gives rolling(window, min_periods=min_periods).mean() semantics: the
+    warmup rows (and windows containing NaN prices) get the mean of the
+    non-NaN prices in the window once min_periods are available. Full
+    windows keep the backend's values.
+
+    Args:
+        df_with_ind: Fresh frame from a backend (columns are replaced, not written into)
+        price: float64 Price array of the same rows
+        min_periods: Minimum observations for a partial mean
+    """
+    valid = ~np.isnan(price)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, price, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    idx = np.arange(1, len(price) + 1)
+
+    for col, window in (('SMA_50', 50), ('SMA_200', 200)):
+        sma = df_with_ind[col].to_numpy(dtype=np.float64, copy=True)
+        missing = np.isnan(sma)
+        if not missing.any():
+            continue
+
+        # Window [max(0, i-window+1), i] sums/counts from the prefix sums
+        lo = np.maximum(idx - window, 0)
+        sums = csum[idx] - csum[lo]
+        counts = ccount[idx] - ccount[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            partial = np.where(counts >= max(min_periods, 1), sums / counts, np.nan)
+
+        sma[missing] = partial[missing]
+        df_with_ind[col] = sma.astype(df_with_ind[col].dtype, copy=False)
+
+
+def _with_indicators(df_past: pd.DataFrame, outputs: Dict, dtype=np.float64) -> pd.DataFrame:
+    """
+    Build the result frame: every input column plus the indicator arrays.
+
+    Input columns are copied, so writing to the result never reaches the
+    caller's frame (nor a cached result); the indicator arrays are fresh
+    and are used without a further copy.
+
+    Args:
+        df_past: Date-filtered view of the input frame
+        outputs: Indicator name -> array of len(df_past)
+        dtype: Indicator column dtype
+
+    Returns:
+        New DataFrame with df_past's index
+    """
+    columns = {name: col.copy() for name, col in df_past.items()}
+    for col in INDICATOR_COLUMNS:
+        columns[col] = np.asarray(outputs[col], dtype=dtype)
+    return pd.DataFrame(columns, index=df_past.index, copy=False)
+
+
+def _price_arrays(df_past: pd.DataFrame, dtype=np.float64):
+    """
+    Extract contiguous Price/High/Low arrays, aliasing Price for missing High/Low.
+
+    Returns:
+        Tuple (price, high, low); high/low are the price array itself when absent
+    """
+    def column(name):
+        return np.ascontiguousarray(df_past[name].to_numpy(), dtype=dtype)
+
+    price = column('Price')
+    high = column('High') if 'High' in df_past.columns else price
+    low = column('Low') if 'Low' in df_past.columns else price
+    return price, high, low
+
+
+def _calculate_indicators_numba(df_past: pd.DataFrame, dtype=np.float64) -> pd.DataFrame:
+    """
+    Compute all indicators with the fused Numba kernel (one pass, same values as `ta`).
+
+    Args:
+        df_past: Date-filtered DataFrame with Price (and optionally High, Low)
+        dtype: Input/output array dtype (float32 or float64)
+
+    Returns:
+        df_past with indicator columns added
+    """
+    n = len(df_past)
+
+    price, high, low = _price_arrays(df_past, dtype)
+    rsi, atr, macd, macd_signal, macd_diff, sma_50, sma_200 = _compute_indicators_numba(
+        price, high, low
+    )
+
+    # Same minimum-length rule as the `ta` path (ATR warmup would otherwise be 0s)
+    if n < 14:
+        atr[:] = np.nan
+
+    return _with_indicators(df_past, {
+        'RSI': rsi,
+        'ATR': atr,
+        'MACD': macd,
+        'MACD_signal': macd_signal,
+        'MACD_diff': macd_diff,
+        'SMA_50': sma_50,
+        'SMA_200': sma_200
+    }, dtype)
+
+
+def _calculate_indicators_talib(df_past: pd.DataFrame, dtype=np.float64) -> pd.DataFrame:
+    """
+    Compute all indicators with TA-Lib on raw float64 arrays.
+
+    Same outputs as the `ta` path. TA-Lib seeds RSI/MACD EMAs with an SMA,
+    so the first few dozen values differ slightly before converging.
+
+    Args:
+        df_past: Date-filtered DataFrame with Price (and optionally High, Low)
+        dtype: Output dtype (TA-Lib itself always computes in float64)
+
+    Returns:
+        df_past with indicator columns added
+    """
+    n = len(df_past)
+    nan = np.full(n, np.nan)
 
-    if len(df_past) >= 200:
-        df_past['SMA_200'] = df_past['Price'].rolling(window=200).mean()
+    price, high, low = _price_arrays(df_past)
+
+    if n >= 26:
+        macd, macd_signal, macd_diff = talib.MACD(price, fastperiod=12, slowperiod=26, signalperiod=9)
     else:
-        df_past['SMA_200'] = np.nan
+        macd = macd_signal = macd_diff = nan
+
+    return _with_indicators(df_past, {
+        'RSI': talib.RSI(price, timeperiod=14) if n >= 14 else nan,
+        'ATR': talib.ATR(high, low, price, timeperiod=14) if n >= 14 else nan,
+        'MACD': macd,
+        'MACD_signal': macd_signal,
+        'MACD_diff': macd_diff,
+        'SMA_50': talib.SMA(price, timeperiod=50) if n >= 50 else nan,
+        'SMA_200': talib.SMA(price, timeperiod=200) if n >= 200 else nan
+    }, dtype)
+
 
-    return df_past
+# Full-history indicator frames, keyed by a digest of the data they were
+# computed from (so an edited frame is never served stale indicators)
+_INDICATOR_CACHE: "OrderedDict" = OrderedDict()
+_INDICATOR_CACHE_SIZE = 4
 
+# Columns the indicator frame depends on
+_SOURCE_COLUMNS = ('Date', 'Price', 'High', 'Low')
 
-def get_latest_indicators(df: pd.DataFrame, current_date: str) -> Dict:
+
+def _cached_indicator_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate indicators over the full history of df once and reuse them.
+
+    All indicators are causal (row i only depends on rows <= i), so the
+    full-history row for a date equals a fresh calculate_indicators()
+    call up to that date. The cache is keyed on df's Date/Price/High/Low
+    values, so an edited frame is recalculated.
+
+    Args:
+        df: DataFrame with historical data
+
+    Returns:
+        DataFrame with indicator columns for every row of df
+    """
+    key = frame_digest(df, _SOURCE_COLUMNS)
+    df_with_ind = _INDICATOR_CACHE.get(key)
+    if df_with_ind is not None:
+        _INDICATOR_CACHE.move_to_end(key)
+        return df_with_ind
+
+    df_with_ind = calculate_indicators(df, df['Date'].max())
+
+    _INDICATOR_CACHE[key] = df_with_ind
+    while len(_INDICATOR_CACHE) > _INDICATOR_CACHE_SIZE:
+        _INDICATOR_CACHE.popitem(last=False)
+
+    return df_with_ind
+
+
+def get_latest_indicators(
+    df: pd.DataFrame,
+    current_date: DateLike,
+    df_with_ind: Optional[pd.DataFrame] = None
+) -> Dict:
     """
     Get the latest indicator values as of current_date.
 
     Args:
         df: DataFrame with historical data
-        current_date: Date to get indicators for (YYYY-MM-DD)
+        current_date: Date to get indicators for (YYYY-MM-DD string,
+                      pd.Timestamp or np.datetime64)
+        df_with_ind: Precomputed calculate_indicators() output covering
+                     current_date. If None, indicators are computed once
+                     for df and cached across calls.
 
     Returns:
         dict: {
@@ -216,32 +703,236 @@ def get_latest_indicators(df: pd.DataFrame, current_date: str) -> Dict:
     Example:
         indicators = get_latest_indicators(df, '2024-11-10')
         print(f"RSI: {indicators['RSI']:.2f}")
+
+        # Backtest loop: compute once, look up each day
+        df_with_ind = calculate_indicators(df, df['Date'].max())
+        for date in dates:
+            indicators = get_latest_indicators(df, date, df_with_ind=df_with_ind)
     """
-    # Calculate indicators
-    df_with_ind = calculate_indicators(df, current_date)
+    # Calculate indicators (once per df)
+    if df_with_ind is None:
+        df_with_ind = _cached_indicator_frame(df)
+
+    # Date column read fresh each call (zero-copy view), never cached by
+    # object identity, so an edited frame is always seen as it is now
+    dates, dates_sorted = _dates_array(df_with_ind)
+    if dates is None:
+        dates = df_with_ind['Date'].to_numpy()
+
+    # Get the row position for current_date (binary search on sorted dates)
+    current_date = _to_ts(current_date)
+    if dates_sorted:
+        i = int(np.searchsorted(dates, current_date.to_datetime64(), side='left'))
+        if i == len(dates) or dates[i] != current_date.to_datetime64():
+            raise ValueError(f"No data found for date: {current_date}")
+    else:
+        matches = np.flatnonzero((df_with_ind['Date'] == current_date).to_numpy())
+        if len(matches) == 0:
+            raise ValueError(f"No data found for date: {current_date}")
+        i = int(matches[0])
 
-    # Get the row for current_date
-    current_date = pd.Timestamp(current_date)
-    df_current = df_with_ind[df_with_ind['Date'] == current_date]
+    # Extract indicator values (one element per column, fixed column order)
+    indicators = {
+        col: df_with_ind[col].to_numpy()[i] if col in df_with_ind.columns else np.nan
+        for col in INDICATOR_COLUMNS
+    }
+    indicators['date'] = pd.Timestamp(dates[i])
 
-    if df_current.empty:
-        raise ValueError(f"No data found for date: {current_date}")
+    # A date-filtered frame with <14 rows has no ATR (full-history warmup is 0)
+    if i < 13:
+        indicators['ATR'] = np.nan
 
-    # Extract indicator values
-    row = df_current.iloc[0]
+    return indicators
 
-    indicators = {
-        'RSI': row.get('RSI', np.nan),
-        'ATR': row.get('ATR', np.nan),
-        'MACD': row.get('MACD', np.nan),
-        'MACD_signal': row.get('MACD_signal', np.nan),
-        'MACD_diff': row.get('MACD_diff', np.nan),
-        'SMA_50': row.get('SMA_50', np.nan),
-        'SMA_200': row.get('SMA_200', np.nan),
-        'date': row['Date']
+
+def calculate_indicators_batch(df: pd.DataFrame, dates: List[DateLike]) -> Dict[DateLike, Dict]:
+    """
+    Get indicator values for many dates at once (batch backtesting driver).
+
+    Indicators are causal, so one full-history pass serves every date:
+    each date is then a binary-search lookup instead of its own
+    calculate_indicators() call.
+
+    Args:
+        df: DataFrame with historical data
+        dates: Dates to get indicators for (YYYY-MM-DD)
+
+    Returns:
+        dict: {date: get_latest_indicators() dict} for each requested date
+
+    Raises:
+        ValueError: If any date is not present in df
+    """
+    df_with_ind = calculate_indicators(df, df['Date'].max())
+    return {
+        date: get_latest_indicators(df, date, df_with_ind=df_with_ind)
+        for date in dates
     }
 
-    return indicators
+
+# 
+# ONLINE (INCREMENTAL) UPDATE
+# 
+# Same recurrences as _compute_indicators_numba, one bar at a time, so a
+# live loop can add a new bar in O(1) instead of recomputing the history.
+# 
+
+def init_indicator_state(df: Optional[pd.DataFrame] = None) -> Dict:
+    """
+    Create the running state for update_indicators().
+
+    Args:
+        df: Optional history (Price, optionally High/Low) to warm the state
+            up with, oldest row first
+
+    Returns:
+        dict: Indicator state (pass to update_indicators for each new bar)
+    """
+    nan = np.nan
+    state = {
+        'n': 0,
+        'prev_price': nan,
+        # EMA states: weighted value, old weight (+ observation counts)
+        'up_w': nan, 'up_ow': 1.0,
+        'dn_w': nan, 'dn_ow': 1.0,
+        'rsi_n': 0,
+        'fast_w': nan, 'fast_ow': 1.0, 'fast_n': 0,
+        'slow_w': nan, 'slow_ow': 1.0, 'slow_n': 0,
+        'sign_w': nan, 'sign_ow': 1.0, 'sign_n': 0,
+        # ATR: SMA seed over the first 14 true ranges, then Wilder smoothing
+        'tr_sum': 0.0, 'tr_count': 0, 'atr': nan,
+        # SMA: last 200 prices + Kahan-compensated running sums and counts
+        'window': deque(maxlen=200),
+        's50': 0.0, 'c50': 0.0, 'n50': 0,
+        's200': 0.0, 'c200': 0.0, 'n200': 0
+    }
+
+    if df is not None:
+        price, high, low = _price_arrays(df)
+        for p, hi, lo in zip(price.tolist(), high.tolist(), low.tolist()):
+            update_indicators(state, p, hi, lo)
+
+    return state
+
+
+def _kahan_add(total: float, comp: float, value: float) -> Tuple[float, float]:
+    """Compensated addition (same as pandas' rolling sums)."""
+    y = value - comp
+    t = total + y
+    return t, (t - total) - y
+
+
+def update_indicators(
+    state: Dict,
+    price: float,
+    high: Optional[float] = None,
+    low: Optional[float] = None
+) -> Tuple[Dict, Dict]:
+    """
+    Advance the indicators by one bar in O(1).
+
+    The returned row equals the last row of calculate_indicators() over
+    the same history (including ATR being NaN until 14 bars are seen).
+
+    Args:
+        state: From init_indicator_state(); updated in place
+        price: New close price
+        high: New high (defaults to price)
+        low: New low (defaults to price)
+
+    Returns:
+        Tuple (state, row) where row maps INDICATOR_COLUMNS -> float
+
+    Example:
+        state = init_indicator_state(df)            # once, from history
+        state, row = update_indicators(state, 97250.0)  # per new bar
+    """
+    nan = np.nan
+    p = float(price)
+    hi = p if high is None else float(high)
+    lo = p if low is None else float(low)
+    i = state['n']
+    pc = state['prev_price']
+
+    # RSI
+    if i == 0:
+        up = 0.0
+        dn = 0.0
+    else:
+        d = p - pc
+        up = d if d > 0 else 0.0
+        dn = -d if d < 0 else 0.0
+    state['up_w'], state['up_ow'] = _ewm_step(state['up_w'], state['up_ow'], up, 1.0 / 14.0)
+    state['dn_w'], state['dn_ow'] = _ewm_step(state['dn_w'], state['dn_ow'], dn, 1.0 / 14.0)
+    state['rsi_n'] += 1
+    if state['rsi_n'] < 14:
+        rsi = nan
+    elif state['dn_w'] == 0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + state['up_w'] / state['dn_w'])
+
+    # ATR
+    tr = hi - lo
+    if i > 0:
+        for v in (abs(hi - pc), abs(lo - pc)):
+            if v == v and (tr != tr or v > tr):
+                tr = v
+    if i < 14:
+        if tr == tr:
+            state['tr_sum'] += tr
+            state['tr_count'] += 1
+        if i == 13:
+            state['atr'] = state['tr_sum'] / state['tr_count'] if state['tr_count'] > 0 else nan
+    else:
+        state['atr'] = (state['atr'] * 13.0 + tr) / 14.0
+    atr = state['atr'] if i >= 13 else nan
+
+    # MACD
+    state['fast_w'], state['fast_ow'] = _ewm_step(state['fast_w'], state['fast_ow'], p, 2.0 / 13.0)
+    state['slow_w'], state['slow_ow'] = _ewm_step(state['slow_w'], state['slow_ow'], p, 2.0 / 27.0)
+    if p == p:
+        state['fast_n'] += 1
+        state['slow_n'] += 1
+    macd = state['fast_w'] - state['slow_w'] if (state['fast_n'] >= 12 and state['slow_n'] >= 26) else nan
+
+    state['sign_w'], state['sign_ow'] = _ewm_step(state['sign_w'], state['sign_ow'], macd, 2.0 / 10.0)
+    if macd == macd:
+        state['sign_n'] += 1
+    macd_signal = state['sign_w'] if state['sign_n'] >= 9 else nan
+
+    # SMA_50 / SMA_200
+    window = state['window']
+    if p == p:
+        state['s50'], state['c50'] = _kahan_add(state['s50'], state['c50'], p)
+        state['s200'], state['c200'] = _kahan_add(state['s200'], state['c200'], p)
+        state['n50'] += 1
+        state['n200'] += 1
+    if len(window) >= 50:
+        old = window[-50]
+        if old == old:
+            state['s50'], state['c50'] = _kahan_add(state['s50'], state['c50'], -old)
+            state['n50'] -= 1
+    if len(window) == 200:
+        old = window[0]
+        if old == old:
+            state['s200'], state['c200'] = _kahan_add(state['s200'], state['c200'], -old)
+            state['n200'] -= 1
+    window.append(p)
+
+    state['n'] = i + 1
+    state['prev_price'] = p
+
+    row = {
+        'RSI': float(rsi),
+        'ATR': float(atr),
+        'MACD': float(macd),
+        'MACD_signal': float(macd_signal),
+        'MACD_diff': float(macd - macd_signal),
+        'SMA_50': state['s50'] / state['n50'] if state['n50'] >= 50 else nan,
+        'SMA_200': state['s200'] / state['n200'] if state['n200'] >= 200 else nan
+    }
+    return state, row
 
 
 def validate_indicators(indicators: Dict) -> bool:
@@ -279,6 +970,43 @@ def validate_indicators(indicators: Dict) -> bool:
     return True
 
 
+def validate_indicators_batch(df_with_ind: pd.DataFrame) -> bool:
+    """
+    Vectorized validate_indicators() over every row of an indicator frame.
+
+    Same rules (NaN is allowed): RSI in [0, 100], ATR >= 0, SMAs > 0.
+
+    Args:
+        df_with_ind: Output of calculate_indicators()
+
+    Returns:
+        bool: True if all rows pass
+
+    Raises:
+        ValueError: On the first violated rule (reports count and first date)
+    """
+    rsi = df_with_ind['RSI'].to_numpy(dtype=np.float64)
+    atr = df_with_ind['ATR'].to_numpy(dtype=np.float64)
+
+    # Comparisons with NaN are False, so NaN rows never count as bad
+    checks = [
+        ('RSI', (rsi < 0) | (rsi > 100), "should be 0-100"),
+        ('ATR', atr < 0, "should be positive")
+    ]
+    for sma_key in ['SMA_50', 'SMA_200']:
+        checks.append((sma_key, df_with_ind[sma_key].to_numpy(dtype=np.float64) <= 0, "should be positive"))
+
+    for col, bad, rule in checks:
+        if bad.any():
+            first = int(np.argmax(bad))
+            raise ValueError(
+                f"Invalid {col} values in {int(bad.sum())} rows "
+                f"(first: {df_with_ind[col].iat[first]} on {df_with_ind['Date'].iat[first]}; {rule})"
+            )
+
+    return True
+
+
 def interpret_indicators(indicators: Dict) -> Dict:
     """
     Interpret indicator values into trading signals.
@@ -341,8 +1069,62 @@ def interpret_indicators(indicators: Dict) -> Dict:
     return interpretation
 
 
+def interpret_indicators_batch(df_with_ind: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized interpret_indicators() over every row of an indicator frame.
+
+    Same thresholds and NaN handling as the scalar version, evaluated with
+    np.select / np.digitize on whole columns instead of per-row if/elif.
+
+    Args:
+        df_with_ind: Output of calculate_indicators()
+
+    Returns:
+        DataFrame (same index) with categorical columns rsi_signal,
+        macd_signal, trend_signal, volatility
+    """
+    rsi = df_with_ind['RSI'].to_numpy(dtype=np.float64)
+    macd_diff = df_with_ind['MACD_diff'].to_numpy(dtype=np.float64)
+    sma_50 = df_with_ind['SMA_50'].to_numpy(dtype=np.float64)
+    sma_200 = df_with_ind['SMA_200'].to_numpy(dtype=np.float64)
+    atr = df_with_ind['ATR'].to_numpy(dtype=np.float64)
+
+    rsi_signal = np.select([rsi < 30, rsi > 70], ['oversold', 'overbought'], default='neutral')
+    macd_signal = np.select([macd_diff > 0, macd_diff < 0], ['bullish', 'bearish'], default='neutral')
+
+    sma_valid = (sma_50 > 0) & (sma_200 > 0)
+    trend_signal = np.select(
+        [sma_valid & (sma_50 > sma_200), sma_valid & (sma_50 < sma_200)],
+        ['bullish', 'bearish'],
+        default='neutral'
+    )
+
+    # digitize puts NaN in the last bin, matching the scalar fall-through to 'high'
+    volatility = np.array(['low', 'medium', 'high'])[np.digitize(atr, [1000, 2000])]
+
+    return pd.DataFrame({
+        'rsi_signal': pd.Categorical(rsi_signal, categories=['oversold', 'neutral', 'overbought']),
+        'macd_signal': pd.Categorical(macd_signal, categories=['bearish', 'neutral', 'bullish']),
+        'trend_signal': pd.Categorical(trend_signal, categories=['bearish', 'neutral', 'bullish']),
+        'volatility': pd.Categorical(volatility, categories=['low', 'medium', 'high'])
+    }, index=df_with_ind.index)
+
+
 def main():
     """Test technical indicators module."""
+    # Fix Windows console encoding for emojis (only when run as a script,
+    # so library imports never touch the caller's stdout/stderr)
+    if sys.platform == 'win32':
+        try:
+            if hasattr(sys.stdout, 'buffer') and not hasattr(sys.stdout, '_wrapped_utf8'):
+                sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+                sys.stdout._wrapped_utf8 = True
+            if hasattr(sys.stderr, 'buffer') and not hasattr(sys.stderr, '_wrapped_utf8'):
+                sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+                sys.stderr._wrapped_utf8 = True
+        except (AttributeError, ValueError, OSError):
+            pass  # Already wrapped or not available
+
     print("="*60)
     print("MODULE 1: TECHNICAL INDICATORS - Testing")
     print("="*60)
@@ -365,8 +1147,8 @@ def main():
         df_with_ind = calculate_indicators(df, test_date)
         print(f"   [OK] Calculated {len(df_with_ind)} rows with indicators")
 
-        # Get latest indicators
-        indicators = get_latest_indicators(df, test_date)
+        # Get latest indicators (reuse the frame computed above)
+        indicators = get_latest_indicators(df, test_date, df_with_ind=df_with_ind)
 
         print(f"\n Indicator Values:")
         print(f"   RSI: {indicators['RSI']:.2f}")
@@ -97,10 +97,17 @@ USAGE IN LIVE TRADING:
 
 import sys
 import io
+import os
+import json
+import hashlib
+import importlib.util
 from pathlib import Path
 
+# Project root (resolved once; also the base for cache paths)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(_PROJECT_ROOT))
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -116,16 +123,568 @@ if sys.platform == 'win32':
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from datetime import timedelta
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from concurrent.futures import ThreadPoolExecutor
+import joblib
+import sklearn
+from sklearn.ensemble import (
+    RandomForestClassifier, RandomForestRegressor,
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor
+)
 from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error, accuracy_score
 # v1.0: Removed LinearRegression, RobustScaler - using only RandomForest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
+from src.utils.hashing import frame_digest
+
+# Optional: Numba JIT for the rolling linear regression, EMA and window kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels still run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# Optional: bottleneck C moving-window functions (pandas rolling otherwise)
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Optional: Parquet engine for the typed blockchain cache (CSV only otherwise).
+# Only probed here; pandas imports it when reading/writing parquet.
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
 # v1.0: Removed XGBoost/LightGBM - using only RandomForest for simplicity
 
+# Volume strings: '100.90K' -> 100900.0 (see _convert_volume_to_numeric)
+VOLUME_SUFFIX_MULTIPLIERS = {'K': 1000, 'M': 1000000, 'B': 1000000000}
+
+
+# Rows of history the full feature set needs (price_change_30d); the first
+# FULL_FEATURE_WARMUP rows are dropped even when only some features are built
+FULL_FEATURE_WARMUP = 30
+
+BLOCKCHAIN_FEATURES = ('hash_rate', 'mempool_size', 'block_size')
+
+# Model input dtype: sklearn trees split on float32 anyway, so the window
+# matrices are stored as float32 (features themselves are computed in float64)
+MODEL_DTYPE = np.float32
+
+# Every column create_features can build, in output order
+ALL_FEATURES = (
+    'rolling_std', 'high_low_range', 'price_change_pct', 'sma_20', 'sma_ratio',
+    'roc_7d', 'momentum_oscillator', 'volume_spike', 'volume_trend',
+    'higher_highs', 'lower_lows', *BLOCKCHAIN_FEATURES,
+    'price_change_3d', 'price_change_14d', 'price_change_30d', 'distance_from_high',
+    'sma_7', 'sma_30', 'ema_14', 'price_to_sma30',
+    'volume_change', 'volume_ratio', 'volume_std',
+    'roc_14d', 'momentum_acceleration', 'bb_width', 'lr_trend', 'lr_residual'
+)
+
+
+def _volume_value_to_float(val) -> float:
+    """Convert one volume value ('100.90K', 1.5e6, None, ...) to float (0.0 if invalid)."""
+    if pd.isna(val):
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+
+    # Handle string values like '100.90K', '1.5M', '500.00B'
+    val = str(val).strip()
+
+    for suffix, multiplier in VOLUME_SUFFIX_MULTIPLIERS.items():
+        if val.endswith(suffix):
+            try:
+                return float(val[:-1]) * multiplier
+            except ValueError:
+                return 0.0
+
+    # Try direct conversion
+    try:
+        return float(val)
+    except ValueError:
+        return 0.0
+
+
+def _rolling(values: pd.Series, window: int, stat: str) -> pd.Series:
+    """
+    Rolling window statistic, same as values.rolling(window).<stat>().
+
+    Uses bottleneck's move_<stat> on the float64 values when available
+    (NaN until window non-NaN values are in the window, std with ddof=1).
+
+    Args:
+        values: Series to aggregate
+        window: Window size
+        stat: 'mean', 'std', 'max' or 'min'
+
+    Returns:
+        Series aligned with values
+    """
+    if BOTTLENECK_AVAILABLE:
+        move = getattr(bn, 'move_' + stat)
+        kwargs = {'ddof': 1} if stat == 'std' else {}
+        out = move(values.to_numpy(dtype=np.float64), window, min_count=window, **kwargs)
+        return pd.Series(out, index=values.index)
+    return getattr(values.rolling(window=window), stat)()
+
+
+def _pct_change(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    k-period percent change of a float array, same as Series.pct_change(k).
+
+    NaN gaps are forward-filled before the change is taken (pandas'
+    default fill_method='pad'); the first k values are NaN.
+    """
+    if np.isnan(values).any():
+        values = pd.Series(values).ffill().to_numpy()
+    out = np.full(len(values), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[k:] = values[k:] / values[:-k] - 1
+    return out
+
+
+def _rate_of_change(values: np.ndarray, k: int) -> np.ndarray:
+    """(x - x[k ago]) / x[k ago] of a float array; the first k values are NaN."""
+    out = np.full(len(values), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[k:] = (values[k:] - values[:-k]) / values[:-k]
+    return out
+
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    """Dates -> int64 day numbers (days since 1970-01-01, time of day dropped)."""
+    return dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').view(np.int64)
+
+
+# 
+# ROLLING LINEAR REGRESSION (lr_trend / lr_residual)
+# 
+# Row i fits y = mx + b to the w prices before it (prices[i-w:i], x = 0..w-1)
+# with the closed-form least-squares solution; rows < w are NaN.
+#   lr_trend    = fit extrapolated one step ahead (x = w)
+#   lr_residual = last window price - fit at x = w-1
+# 
+
+@njit(cache=True)
+def _rolling_lr_numba(prices, w):
+    """Compiled single pass over the prices (one w-term dot product per row)."""
+    n = prices.shape[0]
+    trend = np.full(n, np.nan)
+    residual = np.full(n, np.nan)
+    x_mean = (w - 1) / 2.0
+    denominator = 0.0
+    for k in range(w):
+        denominator += (k - x_mean) ** 2
+    for i in range(w, n):
+        sum_y = 0.0
+        sum_xy = 0.0  # Σ((x-x̄)y) = Σ((x-x̄)(y-ȳ)) since Σ(x-x̄) = 0
+        for k in range(w):
+            y = prices[i - w + k]
+            sum_y += y
+            sum_xy += (k - x_mean) * y
+        slope = sum_xy / denominator
+        intercept = sum_y / w - slope * x_mean
+        trend[i] = slope * w + intercept
+        residual[i] = prices[i - 1] - (slope * (w - 1) + intercept)
+    return trend, residual
+
+
+def _rolling_lr_numpy(prices: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized NumPy version of _rolling_lr_numba (all windows at once)."""
+    x_centered = np.arange(w) - (w - 1) / 2  # x - x̄
+    x_mean = (w - 1) / 2
+    denominator = np.sum(x_centered ** 2)
+
+    # Row i uses prices[i-w:i]; the last full window (ending at the last row) is unused
+    windows = np.lib.stride_tricks.sliding_window_view(prices, w)[:-1]
+    slope = (windows @ x_centered) / denominator
+    intercept = windows.mean(axis=1) - slope * x_mean
+
+    trend = np.full(len(prices), np.nan)
+    residual = np.full(len(prices), np.nan)
+    trend[w:] = slope * w + intercept
+    residual[w:] = windows[:, -1] - (slope * (w - 1) + intercept)
+    return trend, residual
+
+
+def _rolling_lr(prices: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling closed-form linear regression over float64 prices.
+
+    Args:
+        prices: 1-D price array
+        w: Window size
+
+    Returns:
+        (lr_trend, lr_residual) arrays, NaN for the first w rows
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if len(prices) <= w:
+        return np.full(len(prices), np.nan), np.full(len(prices), np.nan)
+    if NUMBA_AVAILABLE:
+        return _rolling_lr_numba(prices, w)
+    return _rolling_lr_numpy(prices, w)
+
+
+def _window_feature_names(features: List[str]) -> List[str]:
+    """Column names of a window row: <f>_min, <f>_max, <f>_avg per feature, then current_price."""
+    names = [f'{feat}_{stat}' for feat in features for stat in ('min', 'max', 'avg')]
+    names.append('current_price')
+    return names
+
+
+@njit(parallel=True, cache=True)
+def _window_aggregates_numba(values, w, out):
+    """
+    Fused moving min/max/mean, one column per parallel work item.
+
+    Min and max come from monotonic index deques (each row is pushed and
+    popped at most once, O(N) per column). The mean is summed afresh over
+    each window (w adds) rather than kept as a running sum, so a window's
+    values do not depend on where the input range starts. A window holding
+    NaN/inf is reduced directly instead, so it gives the same NaN/inf
+    results as NumPy.
+    """
+    n, f = values.shape
+    for j in prange(f):
+        col = values[:, j]
+        # Deques as index arrays with head/tail pointers (indices only grow)
+        min_q = np.empty(n, np.int64)
+        max_q = np.empty(n, np.int64)
+        min_head = 0
+        min_tail = 0
+        max_head = 0
+        max_tail = 0
+        n_bad = 0
+        for i in range(n):
+            x = col[i]
+            if np.isfinite(x):
+                while min_tail > min_head and col[min_q[min_tail - 1]] >= x:
+                    min_tail -= 1
+                min_q[min_tail] = i
+                min_tail += 1
+                while max_tail > max_head and col[max_q[max_tail - 1]] <= x:
+                    max_tail -= 1
+                max_q[max_tail] = i
+                max_tail += 1
+            else:
+                n_bad += 1
+
+            # Drop the row leaving the window
+            if i >= w:
+                if not np.isfinite(col[i - w]):
+                    n_bad -= 1
+                if min_tail > min_head and min_q[min_head] == i - w:
+                    min_head += 1
+                if max_tail > max_head and max_q[max_head] == i - w:
+                    max_head += 1
+
+            if i >= w - 1:
+                r = i - w + 1
+                if n_bad == 0:
+                    total = 0.0
+                    for t in range(r, i + 1):
+                        total += col[t]
+                    out[r, 3 * j] = col[min_q[min_head]]
+                    out[r, 3 * j + 1] = col[max_q[max_head]]
+                    out[r, 3 * j + 2] = total / w
+                else:
+                    window = col[r:i + 1]
+                    if np.isnan(window).any():
+                        # NumPy propagates NaN (Numba's min/max skip it)
+                        out[r, 3 * j] = np.nan
+                        out[r, 3 * j + 1] = np.nan
+                        out[r, 3 * j + 2] = np.nan
+                    else:
+                        out[r, 3 * j] = window.min()
+                        out[r, 3 * j + 1] = window.max()
+                        out[r, 3 * j + 2] = window.mean()
+    return out
+
+
+def _window_aggregates(values: np.ndarray, w: int) -> np.ndarray:
+    """
+    Min, max and mean of every length-w window of a (N, F) feature matrix.
+
+    Uses the Numba kernel above (one O(N) pass per column) when available,
+    else bottleneck's single-pass moving min/max down each column (if the
+    values are finite) or a strided (N-w+1, F, w) view reduced along the
+    window axis. Means are always summed per window, never as a running
+    sum, so each window's row is the same whatever range it is computed in.
+
+    Args:
+        values: (N, F) float array, N >= w
+        w: Window size
+
+    Returns:
+        (N-w+1, 3F) array, columns <f>_min, <f>_max, <f>_avg per feature
+    """
+    out = np.empty((values.shape[0] - w + 1, 3 * values.shape[1]))
+    if NUMBA_AVAILABLE:
+        return _window_aggregates_numba(np.asarray(values, dtype=np.float64), w, out)
+    windows = np.lib.stride_tricks.sliding_window_view(values, w, axis=0)
+    if BOTTLENECK_AVAILABLE and np.isfinite(values).all():
+        out[:, 0::3] = bn.move_min(values, w, axis=0)[w - 1:]
+        out[:, 1::3] = bn.move_max(values, w, axis=0)[w - 1:]
+    else:
+        out[:, 0::3] = windows.min(axis=2)
+        out[:, 1::3] = windows.max(axis=2)
+    out[:, 2::3] = windows.mean(axis=2)
+    return out
+
+
+def _prediction_rows(
+    df_with_features: pd.DataFrame,
+    ends: List[int],
+    feature_cols: List[str],
+    window_size: int,
+    feature_idx: Dict[str, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Model input rows for the windows ending at the given row counts.
+
+    Row k aggregates feature rows ends[k]-window_size .. ends[k]-1 plus
+    current_price, in training column order; features the model was not
+    trained on are dropped and missing ones stay 0. The aggregates come
+    from one _window_aggregates pass over the rows the windows span (a
+    window's row does not depend on that range, so each row equals a
+    single predict() for that day).
+
+    Args:
+        df_with_features: Output of create_features
+        ends: Row count up to each prediction day (each >= window_size)
+        feature_cols: Base feature columns of the model
+        window_size: Window length
+        feature_idx: Training column name -> position
+
+    Returns:
+        (X, current_prices): (k, n_features) float32 rows and (k,) prices
+    """
+    available_features = [col for col in feature_cols if col in df_with_features.columns]
+    values = df_with_features[available_features].to_numpy(dtype=np.float64)
+    current_prices = df_with_features['Price'].to_numpy()[np.asarray(ends, dtype=np.int64) - 1]
+
+    names = _window_feature_names(available_features)
+    starts = np.asarray(ends, dtype=np.int64) - window_size
+    first = int(starts.min())
+    aggregates = np.empty((len(ends), len(names)))
+    aggregates[:, :-1] = _window_aggregates(values[first:int(starts.max()) + window_size], window_size)[starts - first]
+    aggregates[:, -1] = current_prices
+
+    src = [j for j, name in enumerate(names) if name in feature_idx]
+    X = np.zeros((len(ends), len(feature_idx)), dtype=MODEL_DTYPE)
+    X[:, [feature_idx[names[j]] for j in src]] = aggregates[:, src]
+    return X, current_prices
+
+
+def _batch_windows(
+    feature_engineer,
+    df: pd.DataFrame,
+    days: List[pd.Timestamp],
+    window_size: int
+) -> Tuple[Optional[pd.DataFrame], np.ndarray, np.ndarray]:
+    """
+    Features and last-window ends for several prediction days at once.
+
+    Needs date-sorted df: create_features then slices one memoized frame, so
+    the rows up to each day equal create_features(df, day) for that day.
+
+    Args:
+        feature_engineer: BitcoinFeatureEngineer of the model
+        df: Date-sorted DataFrame with Date, Price, High, Low, Volume
+        days: Prediction days (normalized Timestamps)
+        window_size: Window length
+
+    Returns:
+        (df_with_features, ends, valid): features up to the last day (None if
+        even that day has too little data), feature row count up to each day,
+        and which days predict() would accept
+    """
+    day_values = np.array(days, dtype='datetime64[ns]')
+    try:
+        df_with_features = feature_engineer.create_features(df, max(days))
+    except ValueError:
+        return None, np.zeros(len(days), dtype=np.int64), np.zeros(len(days), dtype=bool)
+
+    # Same checks as create_features / predict for each day on its own
+    n_past = df['Date'].searchsorted(day_values, side='right')
+    ends = df_with_features['Date'].searchsorted(day_values, side='right')
+    valid = (n_past >= 20) & (ends >= window_size)
+    return df_with_features, ends, valid
+
+
+def _predict_pending(model, df: pd.DataFrame, pending: List[Tuple]) -> List[Tuple]:
+    """
+    Batch-predict queued (day, current_price, actual_price) backtest days.
+
+    Args:
+        model: Trained DirectionClassifier or BitcoinPricePredictor
+        df: DataFrame with Date, Price, High, Low, Volume
+        pending: Queued days, all to be predicted with the current model
+
+    Returns:
+        (prediction, current_price, actual_price) for the days that could be
+        predicted (failed days are skipped, as in the per-day loop)
+    """
+    if not pending:
+        return []
+    days = [day for day, _, _ in pending]
+    try:
+        preds = model.predict_batch(df, days)
+    except Exception as e:
+        # Redo this batch one day at a time so only the failing days are lost
+        print(f"   [WARNING] Batch prediction failed ({e}), predicting {len(days)} days individually")
+        preds = []
+        for day in days:
+            try:
+                preds.append(model.predict(df, day))
+            except Exception:
+                preds.append(None)
+    return [(pred, cur, act) for pred, (_, cur, act) in zip(preds, pending) if pred is not None]
+
+
+# 
+# MODEL CACHE (skip retraining on unchanged training data)
+# 
+
+def _training_data_hash(model, X: pd.DataFrame, y: pd.Series) -> str:
+    """
+    Fingerprint a training set plus the (unfitted) model configuration.
+
+    Args:
+        model: sklearn estimator about to be fitted
+        X: Feature matrix
+        y: Targets
+
+    Returns:
+        16-char hex digest (blake2b)
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(np.ascontiguousarray(X.to_numpy()).tobytes())
+    h.update(','.join(X.columns).encode())
+    h.update(np.ascontiguousarray(y.to_numpy()).tobytes())
+    params = sorted((k, repr(v)) for k, v in model.get_params().items())
+    # 'ndarray': fitted on the bare array (no feature_names_in_)
+    h.update(f"{type(model).__name__}|{params}|{sklearn.__version__}|ndarray".encode())
+    return h.hexdigest()
+
+
+def _fit_or_load_model(model, X: pd.DataFrame, y: pd.Series, cache_path: Optional[Path] = None):
+    """
+    Fit model on (X, y), or load the saved fit if the training data is unchanged.
+
+    With cache_path set, the fitted model is saved there (joblib) next to a
+    <name>.meta.json holding the training data hash; a later call with the
+    same data, columns and model parameters loads it instead of refitting.
+
+    The model is fitted on the bare array (X.to_numpy()), so predict() takes
+    plain 2D arrays in X's column order without a feature-name check.
+
+    Args:
+        model: Unfitted sklearn estimator
+        X: Feature matrix
+        y: Targets
+        cache_path: Model file (None = always fit, nothing saved)
+
+    Returns:
+        Fitted model (the loaded one on a cache hit)
+    """
+    if cache_path is None:
+        model.fit(X.to_numpy(), y.to_numpy())
+        return model
+
+    meta_path = cache_path.with_suffix('.meta.json')
+    data_hash = _training_data_hash(model, X, y)
+    if cache_path.exists() and meta_path.exists():
+        try:
+            saved_hash = json.loads(meta_path.read_text()).get('data_hash')
+        except (OSError, ValueError):
+            saved_hash = None
+        if saved_hash == data_hash:
+            try:
+                loaded = joblib.load(cache_path)
+                print(f"   [CACHED] Training data unchanged, loaded saved model ({cache_path.name})")
+                return loaded
+            except Exception as e:
+                print(f"   [WARNING] Error loading saved model: {e}")
+
+    model.fit(X.to_numpy(), y.to_numpy())
+
+    # Temp file + rename, meta written last (a partial write never matches)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        joblib.dump(model, tmp_path, compress=3)
+        os.replace(tmp_path, cache_path)
+        meta_path.write_text(json.dumps({'data_hash': data_hash, 'rows': len(X)}))
+    except OSError as e:
+        print(f"   [WARNING] Error saving model: {e}")
+
+    return model
+
+
+# 
+# EXPONENTIAL MOVING AVERAGE (ema_14)
+# 
+# Same recursion as pandas ewm(span=span, adjust=False).mean():
+#   ema[i] = ((1-a) * ema[i-1] + a * x[i]) / ((1-a) + a),  a = 2 / (span + 1)
+# NaN prices are skipped (the previous weight keeps decaying over the gap).
+# 
+
+@njit(cache=True)
+def _ema_numba(x, span):
+    """Compiled recursive EMA into one preallocated output array."""
+    n = x.shape[0]
+    out = np.empty(n)
+    alpha = 2.0 / (span + 1.0)
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = x[i]
+        is_observation = cur == cur
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def _ema(x: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average, equal to pandas ewm(span=span, adjust=False).mean().
+
+    Args:
+        x: 1-D float array
+        span: EMA span
+
+    Returns:
+        EMA array (same length as x)
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if len(x) == 0 or not NUMBA_AVAILABLE:
+        return pd.Series(x).ewm(span=span, adjust=False).mean().to_numpy()
+    return _ema_numba(x, span)
+
 
 class BitcoinFeatureEngineer:
     """
@@ -145,7 +704,12 @@ class BitcoinFeatureEngineer:
     11. Market Structure Extended (1): bb_width (Bollinger Bands)
     """
 
-    def __init__(self, enable_blockchain: bool = False, use_cached_blockchain: bool = True):
+    def __init__(
+        self,
+        enable_blockchain: bool = False,
+        use_cached_blockchain: bool = True,
+        required_cols: Optional[List[str]] = None
+    ):
         """
         Initialize feature engineer.
 
@@ -153,45 +717,69 @@ class BitcoinFeatureEngineer:
             enable_blockchain: Enable Blockchain.com API features
                               (Disabled for backtesting - historical data unavailable)
             use_cached_blockchain: Use cached historical blockchain data (default: True)
+            required_cols: Feature columns create_features builds by default
+                           (None = all features)
         """
         self.enable_blockchain = enable_blockchain
         self.use_cached_blockchain = use_cached_blockchain
+        self.required_cols = required_cols
         self._blockchain_cache = None  # Cache blockchain data to avoid repeated fetches
+        self._blockchain_by_day = None  # (source df, metrics indexed by int64 day)
+        # Features of the last full input df, sliced per current_date
+        self._feature_cache = {'key': None, 'df': None}
+
+        # Keep-alive session for the Blockchain.com calls (HTTPS connections
+        # are reused; the pool also serves the concurrent history fetch).
+        # requests already asks for gzip/deflate responses by default.
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            raise_on_status=False
+        )
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
 
     def _convert_volume_to_numeric(self, vol_series: pd.Series) -> pd.Series:
         """
         Convert volume strings like '100.90K' to numeric values.
 
+        Vectorized with NumPy string functions for all-string columns:
+        strips a K/M/B suffix and parses all numbers in one array
+        conversion. Mixed columns, or any unparseable value, fall back to
+        the per-value converter.
+
         Args:
             vol_series: Series with volume strings
 
         Returns:
-            Series with numeric volume values
+            Series with numeric volume values (missing/unparseable -> 0.0)
         """
-        def convert_value(val):
-            if pd.isna(val):
-                return 0.0
-            if isinstance(val, (int, float)):
-                return float(val)
-
-            # Handle string values like '100.90K', '1.5M', '500.00B'
-            val = str(val).strip()
-            multipliers = {'K': 1000, 'M': 1000000, 'B': 1000000000}
-
-            for suffix, multiplier in multipliers.items():
-                if val.endswith(suffix):
-                    try:
-                        return float(val[:-1]) * multiplier
-                    except ValueError:
-                        return 0.0
-
-            # Try direct conversion
-            try:
-                return float(val)
-            except ValueError:
-                return 0.0
+        if pd.api.types.is_numeric_dtype(vol_series):
+            return vol_series.astype(np.float64).fillna(0.0)
+        if pd.api.types.infer_dtype(vol_series, skipna=True) != 'string':
+            # Mixed numbers/strings: convert one by one
+            return vol_series.apply(_volume_value_to_float)
+
+        # Handle string values like '100.90K', '1.5M', '500.00B'
+        values = np.strings.strip(vol_series.to_numpy(dtype=str))
+        body = values
+        multiplier = np.ones(len(values))
+        for suffix, suffix_multiplier in VOLUME_SUFFIX_MULTIPLIERS.items():
+            head, sep, tail = np.strings.rpartition(values, suffix)
+            has_suffix = (sep == suffix) & (tail == '')
+            body = np.where(has_suffix, head, body)
+            multiplier[has_suffix] = suffix_multiplier
+
+        missing = vol_series.isna().to_numpy()
+        try:
+            result = np.where(missing, '0', body).astype(np.float64) * multiplier
+        except ValueError:
+            # Some value is not a number: convert one by one (those become 0.0)
+            return vol_series.apply(_volume_value_to_float)
 
-        return vol_series.apply(convert_value)
+        return pd.Series(result, index=vol_series.index)
 
     def _fetch_blockchain_history(self, metric: str, timespan: str = 'all') -> Optional[pd.DataFrame]:
         """
@@ -206,7 +794,7 @@ class BitcoinFeatureEngineer:
         """
         try:
             url = f"https://api.blockchain.info/charts/{metric}?format=json&timespan={timespan}"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
 
             if response.status_code != 200:
                 print(f"   [WARNING] Blockchain.com API returned status {response.status_code} for {metric}")
@@ -218,15 +806,13 @@ class BitcoinFeatureEngineer:
                 print(f"   [WARNING] No 'values' field in response for {metric}")
                 return None
 
-            # Convert to DataFrame
-            records = []
-            for point in data['values']:
-                timestamp = point['x']
-                value = point['y']
-                date = pd.Timestamp(timestamp, unit='s').normalize()  # Convert to date
-                records.append({'Date': date, metric: value})
+            # Convert to DataFrame (column arrays, no per-point dicts/Timestamps)
+            points = data['values']
+            timestamps = np.fromiter((point['x'] for point in points), dtype=np.int64, count=len(points))
+            values = np.fromiter((point['y'] for point in points), dtype=np.float64, count=len(points))
+            dates = pd.to_datetime(timestamps, unit='s').normalize()  # Convert to date
 
-            df = pd.DataFrame(records)
+            df = pd.DataFrame({'Date': dates, metric: values})
 
             print(f"   [OK] Fetched {len(df)} historical records for {metric}")
             return df
@@ -246,16 +832,25 @@ class BitcoinFeatureEngineer:
             DataFrame with Date, hash_rate, mempool_size, block_size columns
         """
         print(f"   [INFO] Loading blockchain history...")
-        cache_path = Path(__file__).parent.parent.parent / cache_file
+        cache_path = _PROJECT_ROOT / cache_file
+        # Typed copy of the same data (no date parsing on load), if pyarrow is installed
+        parquet_path = cache_path.with_suffix('.parquet')
+        cache_paths = [parquet_path, cache_path] if PARQUET_AVAILABLE else [cache_path]
 
         # Check if cache exists and is recent (< 7 days old)
-        if cache_path.exists():
-            cache_age_days = (time.time() - cache_path.stat().st_mtime) / 86400
+        for path in cache_paths:
+            if not path.exists():
+                continue
+
+            cache_age_days = (time.time() - path.stat().st_mtime) / 86400
 
             if cache_age_days < 7:
                 try:
-                    df = pd.read_csv(cache_path)
-                    df['Date'] = pd.to_datetime(df['Date'])
+                    if path.suffix == '.parquet':
+                        df = pd.read_parquet(path)
+                    else:
+                        df = pd.read_csv(path)
+                        df['Date'] = pd.to_datetime(df['Date'])
                     print(f"   [OK] Loaded cached blockchain data ({len(df)} rows, {cache_age_days:.1f} days old)")
                     return df
                 except Exception as e:
@@ -270,16 +865,21 @@ class BitcoinFeatureEngineer:
             'avg-block-size': 'block_size'
         }
 
+        # The 3 requests are independent and I/O-bound - fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(metrics)) as pool:
+            futures = {
+                api_name: pool.submit(self._fetch_blockchain_history, api_name, 'all')
+                for api_name in metrics
+            }
+
         dfs = []
         for api_name, col_name in metrics.items():
-            df = self._fetch_blockchain_history(api_name, timespan='all')
+            df = futures[api_name].result()
 
             if df is not None:
                 df = df.rename(columns={api_name: col_name})
                 dfs.append(df)
 
-            time.sleep(0.5)  # Rate limiting
-
         if len(dfs) == 0:
             print(f"   [WARNING] Failed to fetch any blockchain metrics")
             return None
@@ -296,16 +896,39 @@ class BitcoinFeatureEngineer:
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             merged_df.to_csv(cache_path, index=False)
+            if PARQUET_AVAILABLE:
+                merged_df.to_parquet(parquet_path, compression='zstd', index=False)
             print(f"   [OK] Cached blockchain data to {cache_file}")
         except Exception as e:
             print(f"   [WARNING] Error saving cache: {e}")
 
         return merged_df
 
+    def _blockchain_day_index(self, blockchain_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Blockchain metrics indexed by day number (int64 days since epoch).
+
+        Built once per blockchain DataFrame so create_features can align
+        metrics with a plain integer reindex instead of a Date merge.
+
+        Args:
+            blockchain_df: DataFrame with Date, hash_rate, mempool_size, block_size
+
+        Returns:
+            DataFrame with the 3 metric columns, one row per day (last wins)
+        """
+        if self._blockchain_by_day is None or self._blockchain_by_day[0] is not blockchain_df:
+            day = _day_numbers(blockchain_df['Date'])
+            by_day = blockchain_df[['hash_rate', 'mempool_size', 'block_size']].set_axis(day)
+            by_day = by_day[~by_day.index.duplicated(keep='last')]
+            self._blockchain_by_day = (blockchain_df, by_day)
+        return self._blockchain_by_day[1]
+
     def create_features(
         self,
         df: pd.DataFrame,
-        current_date: str
+        current_date: Union[str, pd.Timestamp],
+        required_cols: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Create custom features for prediction.
@@ -315,222 +938,319 @@ class BitcoinFeatureEngineer:
 
         Args:
             df: DataFrame with Date, Price, High, Low, Volume
-            current_date: Date to create features from (YYYY-MM-DD)
+            current_date: Date to create features from (YYYY-MM-DD or Timestamp)
+            required_cols: Feature columns to build (default: self.required_cols;
+                           None = all features). With a subset, the first
+                           FULL_FEATURE_WARMUP rows are still dropped, but a
+                           later row with NaN only in a feature that was not
+                           built is kept (the full set would drop it).
 
         Returns:
-            DataFrame with added feature columns
+            DataFrame with added feature columns. Input columns named like a
+            feature are never passed through: built features replace them,
+            the rest are dropped.
         """
-        current_date = pd.Timestamp(current_date)
+        if not isinstance(current_date, pd.Timestamp):
+            current_date = pd.Timestamp(current_date)
+        if required_cols is None:
+            required_cols = self.required_cols
+        required = None if required_cols is None else frozenset(required_cols)
+
+        # Every feature only looks backwards (rolling windows, shifts, ewm,
+        # ffill), so for date-sorted input the features up to current_date
+        # equal the rows <= current_date of the features over the whole df.
+        # Backtests call this once per day with the same df, so compute the
+        # full feature frame once and slice it.
+        if df['Date'].is_monotonic_increasing:
+            n_past = int(df['Date'].searchsorted(current_date, side='right'))
+            if n_past < 20:
+                raise ValueError(f"Insufficient data: need at least 20 rows, have {n_past}")
+
+            features = self._full_features(df, required)
+            n_rows = int(features['Date'].searchsorted(current_date, side='right'))
+            return features.iloc[:n_rows].copy()
 
         # Anti-future-data: Only use data up to current_date
-        df_past = df[df['Date'] <= current_date].copy()
+        df_past = df[df['Date'] <= current_date]
 
         if len(df_past) < 20:
             raise ValueError(f"Insufficient data: need at least 20 rows, have {len(df_past)}")
 
+        return self._compute_features(df_past, required)
+
+    def create_features_full(self, df: pd.DataFrame, current_date: Union[str, pd.Timestamp]) -> pd.DataFrame:
+        """Create all feature columns, ignoring self.required_cols."""
+        return self.create_features(df, current_date, required_cols=list(ALL_FEATURES))
+
+    def _full_features(self, df: pd.DataFrame, required: Optional[frozenset] = None) -> pd.DataFrame:
+        """
+        Features over all of df, memoized for repeated calls with the same data.
+
+        The cache is keyed on a digest of every column of df (plus required
+        and the blockchain source), so an in-place edit of any row recomputes.
+
+        Args:
+            df: Date-sorted DataFrame with Date, Price, High, Low, Volume
+            required: Feature columns to build (None = all)
+
+        Returns:
+            Feature DataFrame (do not modify - shared between calls)
+        """
+        blockchain_src = self._blockchain_cache if self.use_cached_blockchain else None
+        key = (frame_digest(df, df.columns), required, id(blockchain_src))
+
+        cache = self._feature_cache
+        if cache['key'] == key:
+            return cache['df']
+
+        features = self._compute_features(df, required)
+
+        # Blockchain history may have been loaded by this first computation
+        blockchain_src = self._blockchain_cache if self.use_cached_blockchain else None
+        key = key[:2] + (id(blockchain_src),)
+        self._feature_cache = {'key': key, 'df': features}
+        return features
+
+    def _compute_features(self, df_past: pd.DataFrame, required: Optional[frozenset] = None) -> pd.DataFrame:
+        """
+        Compute feature columns for df_past.
+
+        Features are collected in a dict and the output frame is built once
+        at the end, so df_past itself is never modified (no defensive copy).
+
+        Args:
+            df_past: DataFrame with rows up to the current date only
+            required: Feature columns to build (None = all). Features outside
+                      it are skipped, including the blockchain data load.
+
+        Returns:
+            DataFrame with added feature columns, NaN rows dropped (in the
+            input columns and the features built)
+        """
+        def wanted(*cols):
+            return required is None or not required.isdisjoint(cols)
+
+        feats = {}  # feature name -> Series / array / scalar, in output order
+        has_volume = 'Vol.' in df_past.columns
+        blockchain_wanted = wanted(*BLOCKCHAIN_FEATURES)
+
+        # Numeric volume ('Vol.' strings), converted once for all volume features
+        vol_numeric = None
+        if has_volume and wanted('volume_spike', 'volume_trend', 'volume_change',
+                                 'volume_ratio', 'volume_std', *BLOCKCHAIN_FEATURES):
+            vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
+
+        # Shared rolling intermediates: each window pass is computed once and
+        # reused by every feature below that needs it
+        price = df_past['Price']
+        price_values = price.to_numpy(dtype=np.float64)
+        if wanted('price_change_pct', *BLOCKCHAIN_FEATURES):
+            price_change_7 = pd.Series(_pct_change(price_values, 7), index=df_past.index)
+        if wanted('sma_20', 'sma_ratio', 'bb_width'):
+            price_mean_20 = _rolling(price, 20, 'mean')
+        if wanted('bb_width'):
+            price_std_20 = _rolling(price, 20, 'std')
+        if wanted('sma_30', 'price_to_sma30', *BLOCKCHAIN_FEATURES):
+            price_mean_30 = _rolling(price, 30, 'mean')
+        if wanted('momentum_oscillator', 'momentum_acceleration'):
+            price_mean_14 = _rolling(price, 14, 'mean')
+            momentum = price / price_mean_14 - 1
+        if vol_numeric is not None:
+            if wanted('volume_trend', *BLOCKCHAIN_FEATURES):
+                vol_change_7 = pd.Series(_pct_change(vol_numeric.to_numpy(dtype=np.float64), 7), index=df_past.index)
+            if wanted('volume_ratio', *BLOCKCHAIN_FEATURES):
+                vol_mean_30 = _rolling(vol_numeric, 30, 'mean')
+
         # 
         # CATEGORY 1: VOLATILITY FEATURES (2)
         # 
 
         # Feature 1: Rolling standard deviation (7-day)
-        df_past['rolling_std'] = df_past['Price'].rolling(window=7).std()
+        if wanted('rolling_std'):
+            feats['rolling_std'] = _rolling(df_past['Price'], 7, 'std')
 
         # Feature 2: High-Low range (normalized by price)
-        df_past['high_low_range'] = (df_past['High'] - df_past['Low']) / df_past['Price']
+        if wanted('high_low_range', *BLOCKCHAIN_FEATURES):
+            feats['high_low_range'] = (df_past['High'] - df_past['Low']) / df_past['Price']
 
         # 
         # CATEGORY 2: TREND FEATURES (2)
         # 
 
         # Feature 3: Price change percentage (7-day)
-        df_past['price_change_pct'] = df_past['Price'].pct_change(periods=7)
+        if wanted('price_change_pct'):
+            feats['price_change_pct'] = price_change_7
 
         # Feature 4: SMA ratio (Price / SMA_20)
-        df_past['sma_20'] = df_past['Price'].rolling(window=20).mean()
-        df_past['sma_ratio'] = df_past['Price'] / df_past['sma_20']
+        if wanted('sma_20', 'sma_ratio'):
+            feats['sma_20'] = price_mean_20
+            feats['sma_ratio'] = df_past['Price'] / feats['sma_20']
 
         # 
         # CATEGORY 3: MOMENTUM FEATURES (2)
         # 
 
         # Feature 5: Rate of Change (7-day ROC)
-        df_past['roc_7d'] = (df_past['Price'] - df_past['Price'].shift(7)) / df_past['Price'].shift(7)
+        if wanted('roc_7d'):
+            feats['roc_7d'] = _rate_of_change(price_values, 7)
 
         # Feature 6: Momentum Oscillator (current price vs 14-day avg)
-        df_past['momentum_oscillator'] = df_past['Price'] / df_past['Price'].rolling(window=14).mean() - 1
+        if wanted('momentum_oscillator'):
+            feats['momentum_oscillator'] = momentum
 
         # 
         # CATEGORY 4: VOLUME FEATURES (2)
         # 
 
-        if 'Vol.' in df_past.columns:
-            vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
-
+        if has_volume:
             # Feature 7: Volume spike (current vol vs 20-day avg)
-            vol_avg = vol_numeric.rolling(window=20).mean()
-            df_past['volume_spike'] = vol_numeric / vol_avg
+            if wanted('volume_spike'):
+                vol_avg = _rolling(vol_numeric, 20, 'mean')
+                feats['volume_spike'] = vol_numeric / vol_avg
 
             # Feature 8: Volume trend (7-day volume change rate)
-            df_past['volume_trend'] = vol_numeric.pct_change(7)
+            if wanted('volume_trend'):
+                feats['volume_trend'] = vol_change_7
         else:
             # Fallback if no volume data
-            df_past['volume_spike'] = 1.0
-            df_past['volume_trend'] = 0.0
+            if wanted('volume_spike'):
+                feats['volume_spike'] = 1.0
+            if wanted('volume_trend'):
+                feats['volume_trend'] = 0.0
 
         # 
         # CATEGORY 5: MARKET STRUCTURE FEATURES (2)
         # 
 
         # Feature 9: Higher highs pattern (price making new highs)
-        rolling_max = df_past['High'].rolling(window=14).max()
-        df_past['higher_highs'] = (df_past['High'] >= rolling_max.shift(1)).astype(float)
+        if wanted('higher_highs'):
+            rolling_max = _rolling(df_past['High'], 14, 'max')
+            feats['higher_highs'] = (df_past['High'] >= rolling_max.shift(1)).astype(float)
 
         # Feature 10: Lower lows pattern (price making new lows)
-        rolling_min = df_past['Low'].rolling(window=14).min()
-        df_past['lower_lows'] = (df_past['Low'] <= rolling_min.shift(1)).astype(float)
+        if wanted('lower_lows'):
+            rolling_min = _rolling(df_past['Low'], 14, 'min')
+            feats['lower_lows'] = (df_past['Low'] <= rolling_min.shift(1)).astype(float)
 
         # 
         # CATEGORY 6: BITCOIN-SPECIFIC FEATURES (3)
         # 
 
-        # Try to load historical blockchain data (cached to avoid repeated fetches)
-        if self.use_cached_blockchain and self._blockchain_cache is None:
-            self._blockchain_cache = self._load_or_fetch_blockchain_history()
+        # (skipped, including the data load, when no blockchain feature is required)
+        if blockchain_wanted:
+            # Try to load historical blockchain data (cached to avoid repeated fetches)
+            if self.use_cached_blockchain and self._blockchain_cache is None:
+                self._blockchain_cache = self._load_or_fetch_blockchain_history()
 
-        blockchain_df = self._blockchain_cache if self.use_cached_blockchain else None
+            blockchain_df = self._blockchain_cache if self.use_cached_blockchain else None
 
-        if blockchain_df is not None:
-            # Merge blockchain data with price data by date
-            df_past = df_past.merge(
-                blockchain_df[['Date', 'hash_rate', 'mempool_size', 'block_size']],
-                on='Date',
-                how='left'
-            )
+            # Proxies: volume-based (price-based if volume not available)
+            if has_volume:
+                proxies = {'hash_rate': vol_numeric / vol_mean_30, 'mempool_size': vol_change_7}
+            else:
+                proxies = {'hash_rate': price / price_mean_30, 'mempool_size': price_change_7}
+            proxies['block_size'] = _rolling(feats['high_low_range'], 7, 'mean')
 
-            # Fill missing values with forward fill (use last known value)
-            df_past['hash_rate'] = df_past['hash_rate'].ffill()
-            df_past['mempool_size'] = df_past['mempool_size'].ffill()
-            df_past['block_size'] = df_past['block_size'].ffill()
-
-            # If still missing (no historical data for early dates), use volume proxy
-            if df_past['hash_rate'].isna().any():
-                if 'Vol.' in df_past.columns:
-                    vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
-                    df_past['hash_rate'] = df_past['hash_rate'].fillna(
-                        vol_numeric / vol_numeric.rolling(30).mean()
-                    )
-                else:
-                    df_past['hash_rate'] = df_past['hash_rate'].fillna(
-                        df_past['Price'] / df_past['Price'].rolling(30).mean()
-                    )
-
-            if df_past['mempool_size'].isna().any():
-                if 'Vol.' in df_past.columns:
-                    vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
-                    df_past['mempool_size'] = df_past['mempool_size'].fillna(
-                        vol_numeric.pct_change(7)
-                    )
-                else:
-                    df_past['mempool_size'] = df_past['mempool_size'].fillna(
-                        df_past['Price'].pct_change(7)
-                    )
+            if blockchain_df is not None:
+                # Join blockchain data with price data by day: integer reindex on
+                # the cached day-keyed metrics, then one forward fill over all 3
+                # columns (use last known value)
+                metrics = self._blockchain_day_index(blockchain_df).reindex(_day_numbers(df_past['Date'])).ffill()
 
-            if df_past['block_size'].isna().any():
-                df_past['block_size'] = df_past['block_size'].fillna(
-                    df_past['high_low_range'].rolling(7).mean()
-                )
+                # If still missing (no historical data for early dates), use proxy
+                for col in BLOCKCHAIN_FEATURES:
+                    feats[col] = pd.Series(metrics[col].to_numpy(), index=df_past.index).fillna(proxies[col])
 
-        else:
-            # Fallback to volume proxies if blockchain data unavailable
-            print(f"   [WARNING] Using volume proxies for blockchain features")
-
-            if 'Vol.' in df_past.columns:
-                # Convert volume strings to numeric
-                vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
-                df_past['hash_rate'] = vol_numeric / vol_numeric.rolling(30).mean()
-                df_past['mempool_size'] = vol_numeric.pct_change(7)
             else:
-                # Fallback to price-based proxies if volume not available
-                df_past['hash_rate'] = df_past['Price'] / df_past['Price'].rolling(30).mean()
-                df_past['mempool_size'] = df_past['Price'].pct_change(7)
-
-            df_past['block_size'] = df_past['high_low_range'].rolling(7).mean()
+                # Fallback to volume proxies if blockchain data unavailable
+                print(f"   [WARNING] Using volume proxies for blockchain features")
+                feats.update(proxies)
 
         # 
         # CATEGORY 7: ADDITIONAL PRICE FEATURES (4) - NEW
         # 
 
         # Feature 11: Price change (3-day)
-        df_past['price_change_3d'] = df_past['Price'].pct_change(periods=3)
+        if wanted('price_change_3d'):
+            feats['price_change_3d'] = _pct_change(price_values, 3)
 
         # Feature 12: Price change (14-day)
-        df_past['price_change_14d'] = df_past['Price'].pct_change(periods=14)
+        if wanted('price_change_14d'):
+            feats['price_change_14d'] = _pct_change(price_values, 14)
 
         # Feature 13: Price change (30-day)
-        df_past['price_change_30d'] = df_past['Price'].pct_change(periods=30)
+        if wanted('price_change_30d'):
+            feats['price_change_30d'] = _pct_change(price_values, 30)
 
         # Feature 14: Distance from 30-day high
-        rolling_high_30 = df_past['High'].rolling(window=30).max()
-        df_past['distance_from_high'] = (rolling_high_30 - df_past['Price']) / df_past['Price']
+        if wanted('distance_from_high'):
+            rolling_high_30 = _rolling(df_past['High'], 30, 'max')
+            feats['distance_from_high'] = (rolling_high_30 - df_past['Price']) / df_past['Price']
 
         # 
         # CATEGORY 8: MOVING AVERAGE FEATURES (4) - NEW
         # 
 
         # Feature 15: SMA 7-day
-        df_past['sma_7'] = df_past['Price'].rolling(window=7).mean()
+        if wanted('sma_7'):
+            feats['sma_7'] = _rolling(df_past['Price'], 7, 'mean')
 
         # Feature 16: SMA 30-day
-        df_past['sma_30'] = df_past['Price'].rolling(window=30).mean()
+        if wanted('sma_30', 'price_to_sma30'):
+            feats['sma_30'] = price_mean_30
 
         # Feature 17: EMA 14-day (exponential moving average)
-        df_past['ema_14'] = df_past['Price'].ewm(span=14, adjust=False).mean()
+        if wanted('ema_14'):
+            feats['ema_14'] = _ema(df_past['Price'].to_numpy(), 14)
 
         # Feature 18: Price to SMA30 ratio
-        df_past['price_to_sma30'] = df_past['Price'] / df_past['sma_30']
+        if wanted('price_to_sma30'):
+            feats['price_to_sma30'] = df_past['Price'] / feats['sma_30']
 
         # 
         # CATEGORY 9: VOLUME FEATURES (3) - NEW
         # 
 
-        if 'Vol.' in df_past.columns:
-            vol_numeric = self._convert_volume_to_numeric(df_past['Vol.'])
-
+        if has_volume:
             # Feature 19: Volume change (1-period)
-            df_past['volume_change'] = vol_numeric.pct_change()
+            if wanted('volume_change'):
+                feats['volume_change'] = _pct_change(vol_numeric.to_numpy(dtype=np.float64), 1)
 
             # Feature 20: Volume ratio (vs 30-day avg)
-            vol_30_avg = vol_numeric.rolling(window=30).mean()
-            df_past['volume_ratio'] = vol_numeric / vol_30_avg
+            if wanted('volume_ratio'):
+                feats['volume_ratio'] = vol_numeric / vol_mean_30
 
             # Feature 21: Volume standard deviation (7-day)
-            df_past['volume_std'] = vol_numeric.rolling(window=7).std()
+            if wanted('volume_std'):
+                feats['volume_std'] = _rolling(vol_numeric, 7, 'std')
         else:
-            df_past['volume_change'] = 0.0
-            df_past['volume_ratio'] = 1.0
-            df_past['volume_std'] = 0.0
+            if wanted('volume_change'):
+                feats['volume_change'] = 0.0
+            if wanted('volume_ratio'):
+                feats['volume_ratio'] = 1.0
+            if wanted('volume_std'):
+                feats['volume_std'] = 0.0
 
         # 
         # CATEGORY 10: MOMENTUM FEATURES (2) - NEW
         # 
 
         # Feature 22: Rate of Change (14-day)
-        df_past['roc_14d'] = (df_past['Price'] - df_past['Price'].shift(14)) / df_past['Price'].shift(14)
+        if wanted('roc_14d'):
+            feats['roc_14d'] = _rate_of_change(price_values, 14)
 
         # Feature 23: Momentum acceleration (change in momentum)
-        momentum = df_past['Price'] / df_past['Price'].rolling(window=14).mean() - 1
-        df_past['momentum_acceleration'] = momentum - momentum.shift(1)
+        if wanted('momentum_acceleration'):
+            feats['momentum_acceleration'] = momentum.diff()
 
         # 
         # CATEGORY 11: MARKET STRUCTURE FEATURES (1) - NEW
         # 
 
         # Feature 24: Bollinger Band width (volatility indicator)
-        sma_20 = df_past['Price'].rolling(window=20).mean()
-        std_20 = df_past['Price'].rolling(window=20).std()
-        upper_band = sma_20 + (2 * std_20)
-        lower_band = sma_20 - (2 * std_20)
-        df_past['bb_width'] = (upper_band - lower_band) / sma_20
+        # (upper - lower) / SMA_20 with bands at SMA_20 ± 2 std = 4 std / SMA_20
+        if wanted('bb_width'):
+            feats['bb_width'] = 4 * price_std_20 / price_mean_20
 
         #
         # CATEGORY 12: LINEAR REGRESSION FEATURES (2) - NEW v2.0 (OPTIMIZED)
@@ -563,48 +1283,29 @@ class BitcoinFeatureEngineer:
         #   ✓ 48% fewer features (16 vs 31) - less overfitting risk
 
         # Optimized Linear Regression using closed-form least squares
+        # (compiled single pass with Numba, vectorized NumPy otherwise)
         window_size = 7  # Same as prediction window
 
-        # Pre-compute X matrix (same for all windows)
-        X_lr = np.arange(window_size).reshape(-1, 1)
-
-        # Initialize arrays
-        lr_trend = []
-        lr_residual = []
-
-        # Vectorized calculation for each window
-        prices = df_past['Price'].values
-
-        for i in range(window_size, len(prices)):
-            # Get 7-day window
-            window_prices = prices[i-window_size:i]
-
-            # Fast linear regression using closed-form solution
-            # y = mx + b, solve using least squares
-            x_mean = (window_size - 1) / 2
-            y_mean = window_prices.mean()
-
-            numerator = np.sum((np.arange(window_size) - x_mean) * (window_prices - y_mean))
-            denominator = np.sum((np.arange(window_size) - x_mean) ** 2)
-
-            slope = numerator / denominator if denominator != 0 else 0
-            intercept = y_mean - slope * x_mean
-
-            # Feature 25: Linear trend (extrapolated to next step)
-            trend = slope * window_size + intercept
-            lr_trend.append(trend)
-
-            # Feature 26: Residual (actual vs predicted)
-            predicted_current = slope * (window_size - 1) + intercept
-            residual = window_prices[-1] - predicted_current
-            lr_residual.append(residual)
-
-        # Assign to dataframe (pad with NaN for first window_size rows)
-        df_past['lr_trend'] = np.nan
-        df_past['lr_residual'] = np.nan
-
-        df_past.iloc[window_size:, df_past.columns.get_loc('lr_trend')] = lr_trend
-        df_past.iloc[window_size:, df_past.columns.get_loc('lr_residual')] = lr_residual
+        # Feature 25: Linear trend (extrapolated to next step)
+        # Feature 26: Residual (actual vs predicted)
+        if wanted('lr_trend', 'lr_residual'):
+            lr_trend, lr_residual = _rolling_lr(df_past['Price'].to_numpy(), window_size)
+            feats['lr_trend'] = lr_trend
+            feats['lr_residual'] = lr_residual
+
+        # One frame with the input columns plus the features: a feature that is
+        # also an input column replaces it in place, new ones are appended.
+        # Precomputed feature columns in the input are not trusted: one that
+        # was not built here is dropped rather than passed through.
+        columns = {col: df_past[col] for col in df_past.columns
+                   if col in feats or col not in ALL_FEATURES}
+        columns.update(feats)
+        df_past = pd.DataFrame(columns, index=df_past.index)
+
+        # With only some features built, still drop the warm-up rows the full
+        # set would lose (later NaN rows depend on which features are built)
+        if required is not None:
+            df_past = df_past.iloc[FULL_FEATURE_WARMUP:]
 
         # Drop NaN rows (created by rolling windows)
         df_past = df_past.dropna()
@@ -627,21 +1328,21 @@ class BitcoinFeatureEngineer:
 
             # Fetch hash rate (TH/s)
             hash_rate_url = f"{base_url}/hashrate"
-            response = requests.get(hash_rate_url, timeout=5)
+            response = self._session.get(hash_rate_url, timeout=5)
             hash_rate = float(response.text) if response.status_code == 200 else 0
 
             time.sleep(0.5)  # Rate limit: ~2 requests/second
 
             # Fetch mempool size (bytes)
             mempool_url = f"{base_url}/mempool-size"
-            response = requests.get(mempool_url, timeout=5)
+            response = self._session.get(mempool_url, timeout=5)
             mempool_size = float(response.text) if response.status_code == 200 else 0
 
             time.sleep(0.5)
 
             # Fetch average block size (bytes)
             block_size_url = f"{base_url}/avg-block-size"
-            response = requests.get(block_size_url, timeout=5)
+            response = self._session.get(block_size_url, timeout=5)
             block_size = float(response.text) if response.status_code == 200 else 0
 
             return {
@@ -682,29 +1383,54 @@ class DirectionClassifier:
     - Fast training and prediction
     """
 
-    def __init__(self, window_size: int = 7, horizon: int = 7, n_estimators: int = 100):
+    def __init__(
+        self,
+        window_size: int = 7,
+        horizon: int = 7,
+        n_estimators: int = 100,
+        model_type: str = 'random_forest',
+        model_cache_file: Optional[str] = None
+    ):
         """
         Initialize direction classifier.
 
         Args:
             window_size: Number of days to use as features
             horizon: Number of days ahead to predict direction
-            n_estimators: Number of trees/estimators
+            n_estimators: Number of trees/estimators (random_forest only)
+            model_type: 'random_forest' (default) or 'hist_gradient_boosting'
+                        (histogram-binned boosting, faster to train)
+            model_cache_file: Save the fitted model here (relative to the
+                              project root) and reload it when train() sees
+                              the same data again (None = no caching)
         """
         self.window_size = window_size
         self.horizon = horizon
+        self.model_type = model_type
+        self.model_cache_path = _PROJECT_ROOT / model_cache_file if model_cache_file else None
+
+        if model_type == 'random_forest':
+            # Random Forest classifier
+            self.model = RandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=10,
+                min_samples_split=10,
+                min_samples_leaf=5,
+                random_state=42,
+                n_jobs=-1  # Use all CPU cores
+            )
+        elif model_type == 'hist_gradient_boosting':
+            # Same fit/predict_proba interface; trees grown on binned features
+            self.model = HistGradientBoostingClassifier(
+                max_iter=200,
+                max_depth=8,
+                learning_rate=0.1,
+                early_stopping=True,
+                random_state=42
+            )
+        else:
+            raise ValueError(f"Unknown model_type: {model_type} (use 'random_forest' or 'hist_gradient_boosting')")
 
-        # Random Forest classifier
-        self.model = RandomForestClassifier(
-            n_estimators=n_estimators,
-            max_depth=10,
-            min_samples_split=10,
-            min_samples_leaf=5,
-            random_state=42,
-            n_jobs=-1  # Use all CPU cores
-        )
-
-        self.feature_engineer = BitcoinFeatureEngineer(enable_blockchain=False, use_cached_blockchain=True)
         self.is_trained = False
 
         # OPTION C: Linear Reg + 5 non-redundant features (v2.0)
@@ -735,6 +1461,13 @@ class DirectionClassifier:
             'high_low_range'             # Intraday volatility
         ]
 
+        # Only build the features the classifier uses
+        self.feature_engineer = BitcoinFeatureEngineer(
+            enable_blockchain=False,
+            use_cached_blockchain=True,
+            required_cols=self.feature_cols
+        )
+
     def _create_rolling_windows_for_classification(
         self,
         df: pd.DataFrame,
@@ -754,52 +1487,44 @@ class DirectionClassifier:
         Returns:
             (X, y): Feature matrix and binary direction labels (1=UP, 0=DOWN)
         """
-        X_list = []
-        y_list = []
-
         available_features = [col for col in self.feature_cols if col in df.columns]
 
-        for i in range(len(df) - self.window_size - self.horizon):
-            window = df.iloc[i:i + self.window_size]
-            target_idx = i + self.window_size + self.horizon - 1
-
-            if target_idx >= len(df):
-                break
+        columns = _window_feature_names(available_features)
 
-            current_price = window[target_col].iloc[-1]
-            future_price = df.iloc[target_idx][target_col]
+        # Plain arrays, extracted once (no per-window pandas indexing)
+        feat_values = df[available_features].to_numpy(dtype=np.float64)
+        prices = df[target_col].to_numpy(dtype=np.float64)
 
-            # Calculate direction (only use clear moves >2%)
-            price_change_pct = (future_price - current_price) / current_price
-
-            if price_change_pct > 0.02:
-                direction = 1  # UP
-            elif price_change_pct < -0.02:
-                direction = 0  # DOWN
-            else:
-                continue  # Skip flat movements (improves classifier focus)
+        n_windows = max(len(df) - self.window_size - self.horizon, 0)
+        if n_windows == 0:
+            return pd.DataFrame(columns=columns), pd.Series([], name='direction', dtype=np.int64)
 
-            # Aggregate features
-            window_features = {}
-            for feat in available_features:
-                if feat in window.columns:
-                    window_features[f'{feat}_min'] = window[feat].min()
-                    window_features[f'{feat}_max'] = window[feat].max()
-                    window_features[f'{feat}_avg'] = window[feat].mean()
+        # Window i covers rows i..i+window_size-1; its target is horizon rows later
+        current_price = prices[self.window_size - 1:self.window_size - 1 + n_windows]
+        future_price = prices[self.window_size + self.horizon - 1:][:n_windows]
 
-            window_features['current_price'] = current_price
+        # Direction (only use clear moves >2%; flat windows are skipped)
+        price_change_pct = (future_price - current_price) / current_price
+        up = price_change_pct > 0.02
+        keep = up | (price_change_pct < -0.02)
 
-            X_list.append(window_features)
-            y_list.append(direction)
+        # Aggregate features for all windows at once, then keep the clear moves.
+        # X is column-major: the trees scan one feature at a time
+        aggregates = _window_aggregates(feat_values, self.window_size)[:n_windows]
+        X = np.empty((int(keep.sum()), len(columns)), dtype=MODEL_DTYPE, order='F')
+        X[:, :-1] = aggregates[keep]
+        X[:, -1] = current_price[keep]
+        y = up[keep].astype(np.int64)  # 1 = UP, 0 = DOWN
 
-        X = pd.DataFrame(X_list)
-        y = pd.Series(y_list, name='direction')
+        # NaN -> 0 in place (inf kept, as fillna did)
+        np.nan_to_num(X, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
 
-        X = X.fillna(0)
+        X = pd.DataFrame(X, columns=columns, copy=False)
+        y = pd.Series(y, name='direction')
 
         return X, y
 
-    def train(self, df: pd.DataFrame, current_date: str):
+    def train(self, df: pd.DataFrame, current_date: Union[str, pd.Timestamp]):
         """
         Train the direction classifier.
 
@@ -816,22 +1541,23 @@ class DirectionClassifier:
         if len(X) == 0:
             raise ValueError("Insufficient data to create rolling windows for classification")
 
-        # Train model
-        self.model.fit(X, y)
+        # Train model (or reload the saved fit of the same data)
+        self.model = _fit_or_load_model(self.model, X, y, self.model_cache_path)
         self.is_trained = True
         self.feature_names = X.columns.tolist()
+        self.feature_idx = {name: i for i, name in enumerate(self.feature_names)}
 
     def predict(
         self,
         df: pd.DataFrame,
-        current_date: str
+        current_date: Union[str, pd.Timestamp]
     ) -> Dict:
         """
         Predict price direction with confidence.
 
         Args:
             df: DataFrame with Date, Price, High, Low, Volume
-            current_date: Date to predict from
+            current_date: Date to predict from (YYYY-MM-DD or Timestamp)
 
         Returns:
             dict: {
@@ -844,40 +1570,75 @@ class DirectionClassifier:
         if not self.is_trained:
             raise ValueError("Model not trained. Call train() first.")
 
-        current_date = pd.Timestamp(current_date)
-
-        # Create features
-        df_with_features = self.feature_engineer.create_features(df, str(current_date.date()))
+        # Features up to the start of that day (no str/parse round-trip)
+        if not isinstance(current_date, pd.Timestamp):
+            current_date = pd.Timestamp(current_date)
+        df_with_features = self.feature_engineer.create_features(df, current_date.normalize())
 
         if len(df_with_features) < self.window_size:
             raise ValueError(f"Insufficient data: need at least {self.window_size} rows")
 
-        window = df_with_features.iloc[-self.window_size:]
+        # Aggregated last window in training column order (missing features stay 0)
+        X_pred, _ = _prediction_rows(
+            df_with_features, [len(df_with_features)], self.feature_cols,
+            self.window_size, self.feature_idx
+        )
 
-        # Aggregate features
-        available_features = [col for col in self.feature_cols if col in window.columns]
+        # Predict probabilities
+        return self._direction_result(self.model.predict_proba(X_pred)[0])
 
-        features = {}
-        for feat in available_features:
-            if feat in window.columns:
-                features[f'{feat}_min'] = window[feat].min()
-                features[f'{feat}_max'] = window[feat].max()
-                features[f'{feat}_avg'] = window[feat].mean()
+    def predict_batch(
+        self,
+        df: pd.DataFrame,
+        dates: List[Union[str, pd.Timestamp]]
+    ) -> List[Optional[Dict]]:
+        """
+        Predict direction for several dates with one predict_proba call.
 
-        features['current_price'] = window['Price'].iloc[-1]
+        Same result as predict() for each date, with None where predict()
+        would raise for lack of data. Input that is not date-sorted is
+        predicted one date at a time.
 
-        # Create feature vector
-        X_pred = pd.DataFrame([features])
+        Args:
+            df: DataFrame with Date, Price, High, Low, Volume
+            dates: Dates to predict from
 
-        # Add missing features
-        for col in self.feature_names:
-            if col not in X_pred.columns:
-                X_pred[col] = 0
+        Returns:
+            list: predict() dict (or None) per date
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained. Call train() first.")
 
-        X_pred = X_pred[self.feature_names]
+        days = [pd.Timestamp(d).normalize() for d in dates]
+        if not days:
+            return []
 
-        # Predict probabilities
-        probabilities = self.model.predict_proba(X_pred)[0]
+        if not df['Date'].is_monotonic_increasing:
+            results = []
+            for day in days:
+                try:
+                    results.append(self.predict(df, day))
+                except ValueError:
+                    results.append(None)
+            return results
+
+        df_with_features, ends, valid = _batch_windows(self.feature_engineer, df, days, self.window_size)
+        results = [None] * len(days)
+        if not valid.any():
+            return results
+
+        X_pred, _ = _prediction_rows(
+            df_with_features, ends[valid], self.feature_cols,
+            self.window_size, self.feature_idx
+        )
+        probabilities = self.model.predict_proba(X_pred)
+        for k, proba in zip(np.flatnonzero(valid), probabilities):
+            results[k] = self._direction_result(proba)
+        return results
+
+    @staticmethod
+    def _direction_result(probabilities: np.ndarray) -> Dict:
+        """Direction dict from one row of predict_proba (class 0 = DOWN, 1 = UP)."""
         down_prob = probabilities[0]  # Class 0 = DOWN
         up_prob = probabilities[1]    # Class 1 = UP
 
@@ -927,7 +1688,16 @@ class BitcoinPricePredictor:
     The Decision Box combines ML + RSI + MACD + Fear & Greed for final trade decisions.
     """
 
-    def __init__(self, window_size: int = 7, horizon: int = 7, use_direction_classifier: bool = True, use_ensemble: bool = False):
+    def __init__(
+        self,
+        window_size: int = 7,
+        horizon: int = 7,
+        use_direction_classifier: bool = True,
+        use_ensemble: bool = False,
+        model_type: str = 'random_forest',
+        classifier_model_type: str = 'random_forest',
+        model_cache_dir: Optional[str] = None
+    ):
         """
         Initialize predictor.
 
@@ -936,10 +1706,22 @@ class BitcoinPricePredictor:
             horizon: Number of days ahead to predict
             use_direction_classifier: Use classifier for direction prediction
             use_ensemble: IGNORED - always uses single RandomForest (v1.0)
+            model_type: Price regressor, 'random_forest' (default) or
+                        'hist_gradient_boosting' (histogram-binned boosting,
+                        faster to refit; neither extrapolates past the
+                        training range, lr_trend still carries the trend)
+            classifier_model_type: DirectionClassifier model_type
+                                   ('random_forest' or 'hist_gradient_boosting')
+            model_cache_dir: Directory (relative to the project root) to save
+                             the fitted models in (price_rf.joblib or
+                             price_hgb.joblib, direction_clf.joblib); train()
+                             reloads them when the training data is unchanged
+                             (None = no caching)
         """
         self.window_size = window_size
         self.horizon = horizon
         self.use_direction_classifier = use_direction_classifier
+        self.model_type = model_type
 
         # OPTION C: Linear Reg + 5 non-redundant features (v2.0)
         #
@@ -969,24 +1751,46 @@ class BitcoinPricePredictor:
             'high_low_range'             # Intraday volatility
         ]
 
-        # Single RandomForest model (v1.0 - keep it simple)
-        self.model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            min_samples_split=5,
-            random_state=42,
-            n_jobs=-1  # Use all CPU cores
-        )
+        if model_type == 'random_forest':
+            # Single RandomForest model (v1.0 - keep it simple)
+            self.model = RandomForestRegressor(
+                n_estimators=100,
+                max_depth=10,
+                min_samples_split=5,
+                random_state=42,
+                n_jobs=-1  # Use all CPU cores
+            )
+            model_file = 'price_rf.joblib'
+        elif model_type == 'hist_gradient_boosting':
+            # Same fit/predict interface; trees grown on binned features
+            self.model = HistGradientBoostingRegressor(
+                max_iter=100,
+                max_depth=6,
+                learning_rate=0.1,
+                early_stopping=True,
+                random_state=42
+            )
+            model_file = 'price_hgb.joblib'
+        else:
+            raise ValueError(f"Unknown model_type: {model_type} (use 'random_forest' or 'hist_gradient_boosting')")
+        self.model_cache_path = _PROJECT_ROOT / model_cache_dir / model_file if model_cache_dir else None
 
         # Direction classifier (Random Forest)
         if self.use_direction_classifier:
             self.direction_classifier = DirectionClassifier(
                 window_size=window_size,
                 horizon=horizon,
-                n_estimators=100
+                n_estimators=100,
+                model_type=classifier_model_type,
+                model_cache_file=f"{model_cache_dir}/direction_clf.joblib" if model_cache_dir else None
             )
 
-        self.feature_engineer = BitcoinFeatureEngineer(enable_blockchain=False, use_cached_blockchain=True)
+        # Only build the features the regressor uses
+        self.feature_engineer = BitcoinFeatureEngineer(
+            enable_blockchain=False,
+            use_cached_blockchain=True,
+            required_cols=self.feature_cols
+        )
 
         self.is_trained = False
 
@@ -1009,51 +1813,41 @@ class BitcoinPricePredictor:
         Returns:
             (X, y): Feature matrix and target vector
         """
-        X_list = []
-        y_list = []
-
         # Available features (after feature engineering)
         available_features = [col for col in self.feature_cols if col in df.columns]
 
-        # Create rolling windows
-        for i in range(len(df) - self.window_size - self.horizon):
-            # Window of features
-            window = df.iloc[i:i + self.window_size]
-
-            # Target price (horizon days after window)
-            target_idx = i + self.window_size + self.horizon - 1
-            if target_idx >= len(df):
-                break
-
-            target_price = df.iloc[target_idx][target_col]
+        columns = _window_feature_names(available_features)
 
-            # Aggregate features: min, max, avg
-            window_features = {}
+        n_windows = max(len(df) - self.window_size - self.horizon, 0)
+        if n_windows == 0:
+            return pd.DataFrame(columns=columns), pd.Series([], name='target_price', dtype=np.float64)
 
-            for feat in available_features:
-                if feat in window.columns:
-                    window_features[f'{feat}_min'] = window[feat].min()
-                    window_features[f'{feat}_max'] = window[feat].max()
-                    window_features[f'{feat}_avg'] = window[feat].mean()
+        feat_values = df[available_features].to_numpy(dtype=np.float64)
+        prices = df[target_col].to_numpy(dtype=np.float64)
 
-            # Add current price as feature
-            window_features['current_price'] = window[target_col].iloc[-1]
+        # Rolling windows: window i covers rows i..i+window_size-1, target
+        # price is horizon days after it. Aggregate features: min, max, avg
+        aggregates = _window_aggregates(feat_values, self.window_size)[:n_windows]
+        current_price = prices[self.window_size - 1:self.window_size - 1 + n_windows]
+        target_price = prices[self.window_size + self.horizon - 1:][:n_windows]
 
-            X_list.append(window_features)
-            y_list.append(target_price)
+        # Add current price as feature (X column-major: the trees scan one feature at a time)
+        X = np.empty((n_windows, len(columns)), dtype=MODEL_DTYPE, order='F')
+        X[:, :-1] = aggregates
+        X[:, -1] = current_price
 
-        X = pd.DataFrame(X_list)
-        y = pd.Series(y_list, name='target_price')
+        # Fill any NaN values with 0, in place (inf kept, as fillna did)
+        np.nan_to_num(X, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
 
-        # Fill any NaN values with 0
-        X = X.fillna(0)
+        X = pd.DataFrame(X, columns=columns, copy=False)
+        y = pd.Series(target_price, name='target_price')
 
         return X, y
 
     def train(
         self,
         df: pd.DataFrame,
-        current_date: str
+        current_date: Union[str, pd.Timestamp]
     ):
         """
         Train the prediction model.
@@ -1073,8 +1867,8 @@ class BitcoinPricePredictor:
         if len(X) == 0:
             raise ValueError("Insufficient data to create rolling windows")
 
-        # Train single RandomForest model (v1.0)
-        self.model.fit(X, y)
+        # Train single RandomForest model (v1.0), or reload the saved fit of the same data
+        self.model = _fit_or_load_model(self.model, X, y, self.model_cache_path)
 
         # Train direction classifier (Random Forest)
         if self.use_direction_classifier:
@@ -1082,11 +1876,12 @@ class BitcoinPricePredictor:
 
         self.is_trained = True
         self.feature_names = X.columns.tolist()
+        self.feature_idx = {name: i for i, name in enumerate(self.feature_names)}
 
     def predict(
         self,
         df: pd.DataFrame,
-        current_date: str
+        current_date: Union[str, pd.Timestamp]
     ) -> Dict:
         """
         Predict future price and direction.
@@ -1095,7 +1890,7 @@ class BitcoinPricePredictor:
 
         Args:
             df: DataFrame with Date, Price, High, Low, Volume
-            current_date: Date to predict from
+            current_date: Date to predict from (YYYY-MM-DD or Timestamp)
 
         Returns:
             dict: {
@@ -1112,48 +1907,111 @@ class BitcoinPricePredictor:
         if not self.is_trained:
             raise ValueError("Model not trained. Call train() first.")
 
-        current_date_ts = pd.Timestamp(current_date)
+        current_date_ts = current_date if isinstance(current_date, pd.Timestamp) else pd.Timestamp(current_date)
+        current_day = current_date_ts.normalize()
 
-        # Create features
-        df_with_features = self.feature_engineer.create_features(df, str(current_date_ts.date()))
+        # Create features (no str/parse round-trip)
+        df_with_features = self.feature_engineer.create_features(df, current_day)
 
         # Get last window
         if len(df_with_features) < self.window_size:
             raise ValueError(f"Insufficient data: need at least {self.window_size} rows")
 
-        window = df_with_features.iloc[-self.window_size:]
+        # Aggregated last window in training column order (missing features as 0)
+        X_pred, current_prices = _prediction_rows(
+            df_with_features, [len(df_with_features)], self.feature_cols,
+            self.window_size, self.feature_idx
+        )
 
-        # Aggregate features
-        available_features = [col for col in self.feature_cols if col in window.columns]
+        # SIMPLIFIED (v1.0): Single model prediction, no scaling
+        predicted_price = self.model.predict(X_pred)[0]
 
-        features = {}
-        for feat in available_features:
-            if feat in window.columns:
-                features[f'{feat}_min'] = window[feat].min()
-                features[f'{feat}_max'] = window[feat].max()
-                features[f'{feat}_avg'] = window[feat].mean()
+        direction_pred = None
+        if self.use_direction_classifier:
+            direction_pred = self.direction_classifier.predict(df, current_day)
 
-        features['current_price'] = window['Price'].iloc[-1]
+        return self._price_result(predicted_price, current_prices[0], current_date_ts, direction_pred)
 
-        # Create feature vector (ensure same order as training)
-        X_pred = pd.DataFrame([features])
+    def predict_batch(
+        self,
+        df: pd.DataFrame,
+        dates: List[Union[str, pd.Timestamp]]
+    ) -> List[Optional[Dict]]:
+        """
+        Predict future price and direction for several dates at once.
 
-        # Add missing features as 0
-        for col in self.feature_names:
-            if col not in X_pred.columns:
-                X_pred[col] = 0
+        One model.predict (and one classifier predict_proba) call for all
+        dates. Same result as predict() for each date, with None where
+        predict() would raise for lack of data. Input that is not date-sorted
+        is predicted one date at a time.
 
-        # Reorder columns to match training
-        X_pred = X_pred[self.feature_names]
+        Args:
+            df: DataFrame with Date, Price, High, Low, Volume
+            dates: Dates to predict from
 
-        # SIMPLIFIED (v1.0): Single model prediction, no scaling
-        predicted_price = self.model.predict(X_pred)[0]
-        current_price = window['Price'].iloc[-1]
+        Returns:
+            list: predict() dict (or None) per date
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained. Call train() first.")
+
+        timestamps = [d if isinstance(d, pd.Timestamp) else pd.Timestamp(d) for d in dates]
+        if not timestamps:
+            return []
+
+        if not df['Date'].is_monotonic_increasing:
+            results = []
+            for ts in timestamps:
+                try:
+                    results.append(self.predict(df, ts))
+                except ValueError:
+                    results.append(None)
+            return results
+
+        days = [ts.normalize() for ts in timestamps]
+        df_with_features, ends, valid = _batch_windows(self.feature_engineer, df, days, self.window_size)
+
+        direction_preds = [None] * len(days)
+        if self.use_direction_classifier:
+            direction_preds = self.direction_classifier.predict_batch(df, days)
+            valid &= np.array([pred is not None for pred in direction_preds])
+
+        results = [None] * len(days)
+        if not valid.any():
+            return results
+
+        X_pred, current_prices = _prediction_rows(
+            df_with_features, ends[valid], self.feature_cols,
+            self.window_size, self.feature_idx
+        )
+        predicted_prices = self.model.predict(X_pred)
+        for k, predicted_price, current_price in zip(np.flatnonzero(valid), predicted_prices, current_prices):
+            results[k] = self._price_result(predicted_price, current_price, timestamps[k], direction_preds[k])
+        return results
+
+    def _price_result(
+        self,
+        predicted_price: float,
+        current_price: float,
+        current_date_ts: pd.Timestamp,
+        direction_pred: Optional[Dict]
+    ) -> Dict:
+        """
+        Prediction dict returned by predict().
+
+        Args:
+            predicted_price: Model output for the day
+            current_price: Price on the day
+            current_date_ts: Date predicted from
+            direction_pred: DirectionClassifier result (None without classifier)
+
+        Returns:
+            dict: See predict()
+        """
         price_change_pct = (predicted_price - current_price) / current_price
 
         # Predict direction and confidence (Random Forest)
-        if self.use_direction_classifier:
-            direction_pred = self.direction_classifier.predict(df, str(current_date_ts.date()))
+        if direction_pred is not None:
             direction = direction_pred['direction']
             direction_confidence = direction_pred['confidence']
             up_probability = direction_pred.get('up_probability', 0.5)
@@ -1193,7 +2051,7 @@ class BitcoinPricePredictor:
 
 def predict_price_sma(
     df: pd.DataFrame,
-    current_date: str,
+    current_date: Union[str, pd.Timestamp],
     horizon: int = 7,
     sma_windows: Tuple[int, int] = (7, 14)
 ) -> Dict:
@@ -1205,34 +2063,32 @@ def predict_price_sma(
 
     Args:
         df: DataFrame with Date and Price columns
-        current_date: Date to predict from (YYYY-MM-DD)
+        current_date: Date to predict from (YYYY-MM-DD or Timestamp)
         horizon: Days forward to predict (default: 7)
         sma_windows: (short_window, long_window) for trend calculation
 
     Returns:
         dict: Same format as BitcoinPricePredictor.predict()
     """
-    current_date = pd.Timestamp(current_date)
+    if not isinstance(current_date, pd.Timestamp):
+        current_date = pd.Timestamp(current_date)
 
-    # Anti-future-data
-    df_past = df[df['Date'] <= current_date].copy()
+    # Anti-future-data (only the price column is needed)
+    prices = df['Price'].to_numpy(dtype=np.float64)[(df['Date'] <= current_date).to_numpy()]
 
-    if len(df_past) < max(sma_windows):
+    if len(prices) < max(sma_windows):
         raise ValueError(f"Insufficient data: need at least {max(sma_windows)} rows")
 
-    current_price = df_past.iloc[-1]['Price']
+    current_price = prices[-1]
 
-    # Calculate SMAs
+    # Calculate SMAs (last value only - the tail of the series)
     short_window, long_window = sma_windows
-    df_past['SMA_short'] = df_past['Price'].rolling(window=short_window).mean()
-    df_past['SMA_long'] = df_past['Price'].rolling(window=long_window).mean()
-
-    sma_short = df_past.iloc[-1]['SMA_short']
-    sma_long = df_past.iloc[-1]['SMA_long']
+    sma_short = prices[-short_window:].mean()
+    sma_long = prices[-long_window:].mean()
 
     # Calculate daily change rate
-    recent_prices = df_past['Price'].iloc[-short_window:]
-    daily_change = recent_prices.pct_change().mean()
+    recent_prices = prices[-short_window:]
+    daily_change = np.nanmean(_pct_change(recent_prices, 1))
 
     # Project forward
     predicted_price = current_price * ((1 + daily_change) ** horizon)
@@ -1270,7 +2126,9 @@ def predict_price_sma(
 def validate_direction_classifier(
     df: pd.DataFrame,
     start_date: str,
-    end_date: str
+    end_date: str,
+    retrain_frequency: int = 7,
+    model_type: str = 'random_forest'
 ) -> Dict:
     """
     Validate DirectionClassifier (Random Forest) performance.
@@ -1282,6 +2140,10 @@ def validate_direction_classifier(
         df: DataFrame with Date, Price, High, Low, Volume
         start_date: Start of test period
         end_date: End of test period
+        retrain_frequency: Retrain once the training data has grown by this
+            many rows (1=retrain daily); the fitted model is reused in between
+        model_type: 'random_forest' (default) or 'hist_gradient_boosting'
+            (much faster refits)
 
     Returns:
         dict: {
@@ -1299,62 +2161,70 @@ def validate_direction_classifier(
     confidences = []
     high_confidence_correct = []
 
-    current = start_date
     horizon = 7
 
-    classifier = DirectionClassifier(window_size=7, horizon=horizon)
+    # Date -> row lookups built once (first row wins on duplicate dates)
+    dates = df['Date'].tolist()
+    date_to_i = dict(zip(reversed(dates), range(len(dates) - 1, -1, -1)))
+    prices = df['Price'].to_numpy()
+    sorted_dates = np.sort(df['Date'].to_numpy())
+
+    classifier = DirectionClassifier(window_size=7, horizon=horizon, model_type=model_type)
+    last_train_len = None
 
-    while current <= end_date:
+    # Days are queued and predicted in one batch per trained model
+    pending = []
+    scored = []
+
+    for offset in range((end_date - start_date).days + 1):
+        current = start_date + timedelta(days=offset)
         try:
             prediction_date = current + timedelta(days=horizon)
 
             # Check if actual data exists
-            actual_row = df[df['Date'] == prediction_date]
-            if actual_row.empty:
-                current += timedelta(days=1)
+            i_actual = date_to_i.get(prediction_date)
+            i_current = date_to_i.get(current)
+            if i_actual is None or i_current is None:
                 continue
 
-            actual_price = actual_row.iloc[0]['Price']
-            current_price_row = df[df['Date'] == current]
+            # Train classifier (only when enough new data has arrived)
+            train_len = int(np.searchsorted(sorted_dates, current.to_datetime64(), side='right'))
+            if last_train_len is None or train_len - last_train_len >= retrain_frequency:
+                # Days queued for the current model are predicted before it is replaced
+                scored.extend(_predict_pending(classifier, df, pending))
+                pending = []
+                classifier.train(df, current)
+                last_train_len = train_len
 
-            if current_price_row.empty:
-                current += timedelta(days=1)
-                continue
+            pending.append((current, prices[i_current], prices[i_actual]))
 
-            current_price = current_price_row.iloc[0]['Price']
-
-            # Train classifier
-            classifier.train(df, str(current.date()))
-
-            # Predict direction with confidence
-            direction_pred = classifier.predict(df, str(current.date()))
-
-            # Calculate actual direction
-            actual_change = (actual_price - current_price) / current_price
+        except Exception:
+            pass
 
-            if actual_change > 0.02:
-                actual_direction = 'UP'
-            elif actual_change < -0.02:
-                actual_direction = 'DOWN'
-            else:
-                actual_direction = 'FLAT'
+    scored.extend(_predict_pending(classifier, df, pending))
 
-            # Check if prediction was correct
-            pred_direction = direction_pred['direction']
-            confidence = direction_pred['confidence']
+    for direction_pred, current_price, actual_price in scored:
+        # Calculate actual direction
+        actual_change = (actual_price - current_price) / current_price
 
-            correct = (pred_direction == actual_direction)
-            directions_correct.append(correct)
-            confidences.append(confidence)
+        if actual_change > 0.02:
+            actual_direction = 'UP'
+        elif actual_change < -0.02:
+            actual_direction = 'DOWN'
+        else:
+            actual_direction = 'FLAT'
 
-            # Track high confidence predictions (>70%)
-            if confidence > 0.70:
-                high_confidence_correct.append(correct)
+        # Check if prediction was correct
+        pred_direction = direction_pred['direction']
+        confidence = direction_pred['confidence']
 
-        except Exception:
-            pass
+        correct = (pred_direction == actual_direction)
+        directions_correct.append(correct)
+        confidences.append(confidence)
 
-        current += timedelta(days=1)
+        # Track high confidence predictions (>70%)
+        if confidence > 0.70:
+            high_confidence_correct.append(correct)
 
     if len(directions_correct) == 0:
         return {
@@ -1382,7 +2252,9 @@ def validate_module3(
     df: pd.DataFrame,
     start_date: str,
     end_date: str,
-    use_ml: bool = True
+    use_ml: bool = True,
+    retrain_frequency: int = 7,
+    model_type: str = 'random_forest'
 ) -> Dict:
     """
     Validate Module 3 performance using rolling backtest.
@@ -1390,7 +2262,7 @@ def validate_module3(
     Rolling backtest approach:
     1. Split data: 80% train, 20% test
     2. For each day in test period:
-       - Train on all past data
+       - Train on all past data (refit every retrain_frequency days)
        - Predict horizon days ahead
        - Compare to actual price
     3. Calculate MAPE and directional accuracy
@@ -1400,6 +2272,10 @@ def validate_module3(
         start_date: Start of test period
         end_date: End of test period
         use_ml: Use ML predictor (True) or SMA fallback (False)
+        retrain_frequency: Retrain once the training data has grown by this
+            many rows (1=retrain daily); the fitted model is reused in between
+        model_type: 'random_forest' (default) or 'hist_gradient_boosting'
+            (much faster refits)
 
     Returns:
         dict: {
@@ -1417,64 +2293,81 @@ def validate_module3(
     directions_correct = []
 
     # Rolling prediction
-    current = start_date
     horizon = 7
 
+    # Date -> row lookups built once (first row wins on duplicate dates)
+    dates = df['Date'].tolist()
+    date_to_i = dict(zip(reversed(dates), range(len(dates) - 1, -1, -1)))
+    prices = df['Price'].to_numpy()
+    sorted_dates = np.sort(df['Date'].to_numpy())
+
     if use_ml:
-        predictor = BitcoinPricePredictor(window_size=7, horizon=horizon)
+        predictor = BitcoinPricePredictor(
+            window_size=7, horizon=horizon,
+            model_type=model_type, classifier_model_type=model_type
+        )
+        last_train_len = None
 
-    while current <= end_date:
+    # ML days are queued and predicted in one batch per trained model
+    pending = []
+    scored = []
+
+    for offset in range((end_date - start_date).days + 1):
+        current = start_date + timedelta(days=offset)
         try:
             # Prediction date
             prediction_date = current + timedelta(days=horizon)
 
             # Check if actual data exists
-            actual_row = df[df['Date'] == prediction_date]
-            if actual_row.empty:
-                current += timedelta(days=1)
-                continue
-
-            actual_price = actual_row.iloc[0]['Price']
-            current_price_row = df[df['Date'] == current]
-
-            if current_price_row.empty:
-                current += timedelta(days=1)
+            i_actual = date_to_i.get(prediction_date)
+            i_current = date_to_i.get(current)
+            if i_actual is None or i_current is None:
                 continue
 
-            current_price = current_price_row.iloc[0]['Price']
+            actual_price = prices[i_actual]
+            current_price = prices[i_current]
 
             # Make prediction
             if use_ml:
-                # Train on data up to current date
-                predictor.train(df, str(current.date()))
-                prediction = predictor.predict(df, str(current.date()))
+                # Train on data up to current date (only when enough new
+                # data has arrived; the previous fit is reused otherwise)
+                train_len = int(np.searchsorted(sorted_dates, current.to_datetime64(), side='right'))
+                if last_train_len is None or train_len - last_train_len >= retrain_frequency:
+                    # Days queued for the current model are predicted before it is replaced
+                    scored.extend(_predict_pending(predictor, df, pending))
+                    pending = []
+                    predictor.train(df, current)
+                    last_train_len = train_len
+                pending.append((current, current_price, actual_price))
             else:
-                prediction = predict_price_sma(df, str(current.date()), horizon=horizon)
+                prediction = predict_price_sma(df, current, horizon=horizon)
+                scored.append((prediction, current_price, actual_price))
 
-            predicted_price = prediction['predicted_price']
+        except Exception as e:
+            pass  # Skip on error
 
-            # Calculate errors
-            predictions.append(predicted_price)
-            actuals.append(actual_price)
+    if use_ml:
+        scored.extend(_predict_pending(predictor, df, pending))
 
-            # Directional accuracy
-            pred_direction = prediction['direction']
-            actual_change = (actual_price - current_price) / current_price
+    for prediction, current_price, actual_price in scored:
+        predicted_price = prediction['predicted_price']
 
-            if actual_change > 0.02:
-                actual_direction = 'UP'
-            elif actual_change < -0.02:
-                actual_direction = 'DOWN'
-            else:
-                actual_direction = 'FLAT'
+        # Calculate errors
+        predictions.append(predicted_price)
+        actuals.append(actual_price)
 
-            directions_correct.append(pred_direction == actual_direction)
+        # Directional accuracy
+        pred_direction = prediction['direction']
+        actual_change = (actual_price - current_price) / current_price
 
-        except Exception as e:
-            pass  # Skip on error
+        if actual_change > 0.02:
+            actual_direction = 'UP'
+        elif actual_change < -0.02:
+            actual_direction = 'DOWN'
+        else:
+            actual_direction = 'FLAT'
 
-        # Move to next day
-        current += timedelta(days=1)
+        directions_correct.append(pred_direction == actual_direction)
 
     if len(predictions) == 0:
         return {
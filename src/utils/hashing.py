@@ -0,0 +1,40 @@
+"""
+Content fingerprints for DataFrame-keyed caches.
+
+Caches keyed on the DataFrame object (id, length, last row) return stale
+results after an in-place edit of an earlier row; keying on a digest of the
+values avoids that at a fraction of the cost of recomputing.
+"""
+
+import hashlib
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+def frame_digest(df: pd.DataFrame, columns: Iterable[str]) -> bytes:
+    """
+    Digest of df's values in the given columns (absent columns are skipped).
+
+    Numeric columns are hashed as raw bytes (object columns through pandas
+    hash_array); the digest changes whenever a value, the dtype or the
+    length changes.
+
+    Args:
+        df: DataFrame to fingerprint
+        columns: Column names to include
+
+    Returns:
+        16-byte blake2b digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(df)).encode())
+    for col in columns:
+        if col in df.columns:
+            values = df[col].to_numpy()
+            h.update(f"{col}|{values.dtype}".encode())
+            if values.dtype == object:
+                values = pd.util.hash_array(values)
+            h.update(np.ascontiguousarray(values).view(np.uint8))
+    return h.digest()
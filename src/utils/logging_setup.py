@@ -0,0 +1,95 @@
+"""
+Queue-based logging setup.
+
+Console loggers (console_logger) write INFO and above to stdout like the
+print() calls they replace, so scripts that never configure logging still
+see their output. start_queue_logging moves that output onto a background
+QueueListener thread, so log calls on the trading path only enqueue the
+record and the decision loop never blocks on console I/O.
+
+Only the console loggers are touched; root-logger handlers installed by the
+application or a library are left alone.
+"""
+
+import sys
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+CONSOLE_FORMAT = '%(message)s'
+
+# Set on loggers created through console_logger(). The mark lives on the
+# Logger object, so it is shared no matter which path imported this module
+# (src.utils.logging_setup and utils.logging_setup load as two copies).
+_CONSOLE_MARKER = '_console_logger'
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Plain message, prefixed with [WARNING]/[ERROR]/[CRITICAL] at those levels."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = super().format(record)
+        if record.levelno < logging.WARNING:
+            return msg
+        # Keep leading blank lines ahead of the prefix
+        body = msg.lstrip('\n')
+        return f"{msg[:len(msg) - len(body)]}[{record.levelname}] {body}"
+
+
+def _stdout_handler(fmt: str = CONSOLE_FORMAT) -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(ConsoleFormatter(fmt))
+    return handler
+
+
+def console_logger(name: str) -> logging.Logger:
+    """
+    Logger whose INFO+ records are printed to stdout, configured or not.
+
+    Records still propagate to any root handlers the application installs.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        The logger
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(_stdout_handler())
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    setattr(logger, _CONSOLE_MARKER, True)
+    return logger
+
+
+def _console_loggers() -> List[logging.Logger]:
+    """Loggers marked by console_logger(), from any copy of this module."""
+    return [
+        logger for logger in list(logging.Logger.manager.loggerDict.values())
+        if isinstance(logger, logging.Logger) and getattr(logger, _CONSOLE_MARKER, False)
+    ]
+
+
+def start_queue_logging(level: int = logging.INFO, fmt: str = CONSOLE_FORMAT) -> QueueListener:
+    """
+    Route console-logger output through a queue to a background stdout writer.
+
+    Args:
+        level: Level for the console loggers
+        fmt: Format string for the stdout handler
+
+    Returns:
+        Running QueueListener (call .stop() on shutdown to flush pending records)
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+
+    for logger in _console_loggers():
+        logger.handlers[:] = [queue_handler]
+        logger.setLevel(level)
+
+    listener = QueueListener(log_queue, _stdout_handler(fmt), respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Offline tests for BinanceExecutor (no network; HTTP calls are replaced).
+
+Covers the request plumbing around the API: lazy server-time sync, the
+retry policy for signed requests, when order responses are stream-parsed
+and when streamed balances are trusted after an order.
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault('BINANCE_API_KEY', 'test-key')
+os.environ.setdefault('BINANCE_API_SECRET', 'test-secret')
+
+import src.execution.binance_executor as binance_executor
+from src.execution.binance_executor import BinanceExecutor
+
+
+class OfflineExecutor(BinanceExecutor):
+    """Executor whose HTTP layer records requests instead of sending them."""
+
+    __slots__ = ('sent', 'signed_flags', 'responses')
+
+    def __init__(self, responses=None):
+        self.sent = []
+        self.signed_flags = []
+        self.responses = dict(responses or {})
+        super().__init__(use_testnet=True)
+
+    def _send(self, method, endpoint, params=None, stream_fills=False, signed=False):
+        self.sent.append((method, endpoint))
+        self.signed_flags.append(signed)
+        return self.responses[endpoint]
+
+
+def test_construction_is_offline():
+    """Creating an executor sends nothing; /time is synced on the first signed call."""
+    print("\n[1/2] Constructing executor...")
+    executor = OfflineExecutor({'/time': {'serverTime': 0}, '/account': {'balances': []}})
+    assert executor.sent == [], executor.sent
+    print("   [OK] No requests during __init__")
+
+    print("\n[2/2] Two signed requests...")
+    executor._make_request('GET', '/account', signed=True)
+    executor._make_request('GET', '/account', signed=True)
+    assert executor.sent == [('GET', '/time'), ('GET', '/account'), ('GET', '/account')], executor.sent
+    print(f"   [OK] {executor.sent}")
+
+
+
+def test_signed_requests_are_not_replayed():
+    """Signed requests go through the session without urllib3 retries."""
+    executor = OfflineExecutor({'/time': {'serverTime': 0}, '/account': {'balances': []},
+                                '/ticker/price': {'price': '1'}})
+    assert executor._signed_session.get_adapter(executor.base_url).max_retries.total == 0
+    assert executor._session.get_adapter(executor.base_url).max_retries.total == 3
+
+    executor._make_request('GET', '/ticker/price', {'symbol': 'BTCUSDT'})
+    executor._make_request('GET', '/account', signed=True)
+    # /time itself is unsigned
+    assert executor.signed_flags == [False, False, True], executor.signed_flags
+    print(f"   [OK] signed flags: {list(zip(executor.sent, executor.signed_flags))}")
+
+
+
+class _FakeResponse:
+    """Just enough of requests.Response for BinanceExecutor._send."""
+
+    def __init__(self, body, headers):
+        self.status_code = 200
+        self.headers = CaseInsensitiveDict(headers)
+        self.raw = io.BytesIO(body)
+        self.content = body
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def request(self, method, url, **kwargs):
+        return self.response
+
+
+def test_order_response_streaming():
+    """Chunked/gzip order responses are stream-parsed; small plain ones are not."""
+    body = b'{"orderId": 1, "fills": []}'
+    cases = [
+        ({'Transfer-Encoding': 'chunked'}, True),
+        ({'Content-Encoding': 'gzip', 'Content-Length': '100'}, True),
+        ({'Content-Length': str(binance_executor.STREAM_PARSE_MIN_BYTES)}, True),
+        ({'Content-Length': str(len(body))}, False),
+    ]
+
+    streamed = []
+    saved = (binance_executor.IJSON_AVAILABLE, binance_executor._stream_order_response)
+    # ijson itself may not be installed here; the stream parser is replaced
+    binance_executor.IJSON_AVAILABLE = True
+    binance_executor._stream_order_response = lambda raw: streamed.append(raw.read()) or {'streamed': True}
+    try:
+        executor = BinanceExecutor(use_testnet=True)
+        for headers, expect_stream in cases:
+            streamed.clear()
+            executor._signed_session = _FakeSession(_FakeResponse(body, headers))
+            result = executor._send('POST', '/order', 'q', stream_fills=True, signed=True)
+            assert (result == {'streamed': True}) == expect_stream, (headers, result)
+            assert (streamed == [body]) == expect_stream, (headers, streamed)
+            print(f"   [OK] {headers}: {'streamed' if expect_stream else 'buffered'}")
+    finally:
+        binance_executor.IJSON_AVAILABLE, binance_executor._stream_order_response = saved
+
+
+
+def test_stream_balances_after_order():
+    """After an order, balances come from REST until the account update arrives."""
+    order = {'orderId': 1, 'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET',
+             'status': 'FILLED', 'executedQty': '0.01', 'transactTime': 2_000,
+             'fills': [{'price': '50000', 'qty': '0.01'}]}
+    account = {'balances': [{'asset': 'USDT', 'free': '500.0', 'locked': '0.0'}]}
+    # Responses are cached per executor by the rate limiter; start clean
+    binance_executor.binance_limiter.clear_cache()
+    executor = OfflineExecutor({'/time': {'serverTime': 0}, '/order': order, '/account': account})
+    executor._ws_user_live = True
+    executor._ws_balances = {'USDT': (1000.0, 0.0)}
+
+    print("\n[1/3] Before the order: streamed balance...")
+    assert executor.get_balance('USDT')['free'] == 1000.0
+    assert executor.sent == [], executor.sent
+
+    print("\n[2/3] After the order: REST until the fill's account update...")
+    executor.place_market_order('BUY', quote_quantity=500.0)
+    assert executor.get_balance('USDT')['free'] == 500.0
+    assert executor.sent[-1] == ('GET', '/account'), executor.sent
+
+    # An update from before the fill does not make the stream current again
+    executor._apply_account_event({'e': 'outboundAccountPosition', 'u': 1_999,
+                                   'B': [{'a': 'USDT', 'f': '1000.0', 'l': '0.0'}]})
+    assert executor.get_balance('USDT')['free'] == 500.0
+
+    print("\n[3/3] Account update for the fill: streamed balance again...")
+    executor._apply_account_event({'e': 'outboundAccountPosition', 'u': 2_000,
+                                   'B': [{'a': 'USDT', 'f': '499.5', 'l': '0.0'}]})
+    assert executor.get_balance('USDT')['free'] == 499.5
+    print("   [OK] stream -> REST -> stream")
+
+
+if __name__ == "__main__":
+    test_construction_is_offline()
+    test_signed_requests_are_not_replayed()
+    test_order_response_streaming()
+    test_stream_balances_after_order()
+    print("\n[OK] BINANCE EXECUTOR TESTS PASSED")
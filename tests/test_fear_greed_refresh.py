@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Fear & Greed background refresh test (stubbed API client, no network).
+
+Checks that reads come from the refresher's cache, that a failed fetch
+gives the 50/Neutral fallback and is retried after FG_RETRY_INTERVAL, and
+that the refresher thread is shared per client and stops with it.
+"""
+
+import sys
+import gc
+import time
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.modules.module2_sentiment as module2
+from src.modules.module2_sentiment import SentimentAnalyzer
+
+
+class StubAPIClient:
+    """get_fear_greed_index() fails first, then returns a fixed reading."""
+
+    def __init__(self, fail_first: int = 0):
+        self.calls = 0
+        self.fail_first = fail_first
+
+    def get_fear_greed_index(self):
+        self.calls += 1
+        if self.calls <= self.fail_first:
+            raise ConnectionError("stubbed outage")
+        return {'value': 20, 'classification': 'Extreme Fear'}
+
+
+def _refresh_threads():
+    return [t for t in threading.enumerate() if t.name == 'fear-greed-refresh' and t.is_alive()]
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_fear_greed_refresh():
+    saved = (module2.FG_CACHE_TTL, module2.FG_RETRY_INTERVAL)
+    module2.FG_CACHE_TTL = 60       # no second successful fetch during the test
+    module2.FG_RETRY_INTERVAL = 0.2
+    try:
+        print("\n[1/4] Construction starts no thread...")
+        client = StubAPIClient(fail_first=1)
+        n_threads = len(_refresh_threads())
+        analyzer = SentimentAnalyzer(client)
+        assert len(_refresh_threads()) == n_threads
+        assert client.calls == 0
+        print("   [OK] No fetch before the first read")
+
+        print("\n[2/4] First read after a failed fetch: neutral fallback...")
+        started = time.monotonic()
+        score = analyzer.get_fear_greed_score()
+        assert score == {'value': 50, 'classification': 'Neutral (API Error)',
+                         'signal': 'HOLD', 'confidence': 0.5}, score
+        print(f"   [OK] {score}")
+
+        print("\n[3/4] Retried after FG_RETRY_INTERVAL, then read from cache...")
+        assert _wait_for(lambda: client.calls == 2)
+        assert time.monotonic() - started >= module2.FG_RETRY_INTERVAL * 0.9
+        assert _wait_for(lambda: analyzer.get_fear_greed_score()['value'] == 20)
+        score = analyzer.get_fear_greed_score()
+        assert score == {'value': 20, 'classification': 'Extreme Fear',
+                         'signal': 'BUY', 'confidence': 0.5}, score
+        time.sleep(0.3)
+        assert client.calls == 2, client.calls  # reads never fetch
+        print(f"   [OK] {score} after {client.calls} fetches")
+
+        print("\n[4/4] One thread per client, stopped when the client goes...")
+        other = SentimentAnalyzer(client)
+        assert other.get_fear_greed_score()['value'] == 20
+        assert len(_refresh_threads()) == n_threads + 1
+        analyzer = other = client = None
+        gc.collect()
+        assert _wait_for(lambda: len(_refresh_threads()) == n_threads)
+        print("   [OK] Refresher thread exited")
+    finally:
+        module2.FG_CACHE_TTL, module2.FG_RETRY_INTERVAL = saved
+
+
+def test_no_client_is_neutral():
+    score = SentimentAnalyzer(api_client=None).get_fear_greed_score()
+    assert score == {'value': 50, 'classification': 'Neutral',
+                     'signal': 'HOLD', 'confidence': 0.5}, score
+
+
+if __name__ == "__main__":
+    test_fear_greed_refresh()
+    test_no_client_is_neutral()
+    print("\n[OK] FEAR & GREED REFRESH TEST PASSED")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Queue logging test: start_queue_logging() as live_trader.py calls it.
+
+live_trader puts src/ on sys.path and imports utils.logging_setup, while the
+executor imports src.utils.logging_setup, so the two load as separate module
+copies. The executor's console logger must still be moved onto the queue.
+"""
+
+import sys
+import logging
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+# Same path setup as live_trader.py (project root for src.*, src/ for the rest)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from execution.binance_executor import log as executor_log
+from utils.logging_setup import start_queue_logging
+
+
+class _ListHandler(logging.Handler):
+    """Collects formatted messages."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def test_queue_logging_swaps_executor_handlers():
+    """Executor logger goes through the queue and still reaches stdout."""
+    print("\n[1/2] start_queue_logging() with live_trader's imports...")
+    original_handlers = list(executor_log.handlers)
+    listener = start_queue_logging()
+    try:
+        assert executor_log.handlers, "executor logger has no handlers"
+        assert all(isinstance(h, QueueHandler) for h in executor_log.handlers), \
+            f"handlers not swapped: {executor_log.handlers}"
+        print(f"   [OK] {executor_log.name}: {executor_log.handlers}")
+
+        print("\n[2/2] Records reach the listener's handler...")
+        collected = _ListHandler()
+        listener.handlers = listener.handlers + (collected,)
+        executor_log.info("queued info")
+        executor_log.warning("queued warning")
+    finally:
+        listener.stop()
+        executor_log.handlers[:] = original_handlers
+
+    assert collected.messages == ["queued info", "queued warning"], collected.messages
+    print(f"   [OK] {collected.messages}")
+
+
+if __name__ == "__main__":
+    test_queue_logging_swaps_executor_handlers()
+    print("\n[OK] QUEUE LOGGING TEST PASSED")
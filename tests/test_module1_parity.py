@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Module 1 parity test: indicator values against the original implementation.
+
+BASELINE holds get_latest_indicators() output of the original pandas/`ta`
+implementation on data/processed/bitcoin_clean.csv. The fast paths (Numba
+kernel, cached full-history frame) must reproduce it, and the backends
+must agree with each other over the whole history.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+
+import src.modules.module1_technical as module1
+from src.modules.module1_technical import calculate_indicators, get_latest_indicators
+
+# get_latest_indicators() of the original implementation (12 significant digits)
+BASELINE = {
+    '2019-03-15': {'RSI': 58.0760180235, 'ATR': 106.806519609, 'MACD': 42.2271015357,
+                   'MACD_signal': 45.855527814, 'MACD_diff': -3.62842627833,
+                   'SMA_50': 3712.9684, 'SMA_200': 4901.96425},
+    '2022-06-01': {'RSI': 43.5690193316, 'ATR': 1771.63428873, 'MACD': -1131.72534323,
+                   'MACD_signal': -1653.53674333, 'MACD_diff': 521.811400102,
+                   'SMA_50': 34617.3314, 'SMA_200': 42452.2075},
+    '2025-01-10': {'RSI': 46.5244747232, 'ATR': 3787.69363892, 'MACD': -336.797900397,
+                   'MACD_signal': -25.326313365, 'MACD_diff': -311.471587032,
+                   'SMA_50': 97573.8068, 'SMA_200': 73134.6151},
+}
+
+
+def load_data() -> pd.DataFrame:
+    df = pd.read_csv(PROJECT_ROOT / 'data' / 'processed' / 'bitcoin_clean.csv')
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+
+def test_latest_indicators_match_baseline():
+    """Cached and explicit lookups reproduce the original values."""
+    df = load_data()
+    df_with_ind = calculate_indicators(df, df['Date'].max())
+    for date, expected in BASELINE.items():
+        for result in (get_latest_indicators(df, date),
+                       get_latest_indicators(df, date, df_with_ind=df_with_ind)):
+            assert result['date'] == pd.Timestamp(date)
+            for key, value in expected.items():
+                assert np.isclose(result[key], value, rtol=1e-9), (date, key, result[key], value)
+        print(f"   [OK] {date}: {len(expected)} indicators match")
+
+
+def test_backends_agree():
+    """The Numba kernel and the `ta` reference give the same full history."""
+    df = load_data()
+    saved = module1.NUMBA_AVAILABLE, module1.TALIB_AVAILABLE
+    try:
+        frames = {}
+        for name, numba_on in (('numba', True), ('ta', False)):
+            if numba_on and not saved[0]:
+                continue
+            module1.NUMBA_AVAILABLE, module1.TALIB_AVAILABLE = numba_on, False
+            frames[name] = calculate_indicators(df, df['Date'].max())
+    finally:
+        module1.NUMBA_AVAILABLE, module1.TALIB_AVAILABLE = saved
+
+    reference = frames.pop('ta')
+    for name, frame in frames.items():
+        for col in module1.INDICATOR_COLUMNS:
+            assert np.allclose(frame[col], reference[col], rtol=1e-9, atol=1e-9, equal_nan=True), (name, col)
+        print(f"   [OK] {name} == ta over {len(frame)} rows")
+
+
+def test_cache_sees_in_place_edits():
+    """An in-place price edit invalidates the cached indicator frame."""
+    df = load_data()
+    date = '2022-06-01'
+    before = get_latest_indicators(df, date)['ATR']
+    row = df.index[df['Date'] == pd.Timestamp(date)][0] - 3
+    df.loc[row, 'High'] *= 1.5
+    after = get_latest_indicators(df, date)['ATR']
+    fresh = calculate_indicators(df, date)['ATR'].iloc[-1]
+    assert after != before and np.isclose(after, fresh, rtol=1e-12), (before, after, fresh)
+    print(f"   [OK] ATR {before:.2f} -> {after:.2f} after editing an earlier row")
+
+
+def test_result_does_not_alias_input():
+    """Writing to calculate_indicators() output leaves the caller's frame alone."""
+    df = load_data()
+    price = df['Price'].to_numpy().copy()
+    out = calculate_indicators(df, df['Date'].max())
+    out['Price'].to_numpy()[:] = -1.0
+    assert np.array_equal(df['Price'].to_numpy(), price)
+    print("   [OK] input unchanged")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print("MODULE 1 PARITY TEST")
+    print("="*70)
+    test_latest_indicators_match_baseline()
+    test_backends_agree()
+    test_cache_sees_in_place_edits()
+    test_result_does_not_alias_input()
+    print("\n[OK] MODULE 1 PARITY TEST PASSED")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Module 2 RAG test: get_rag_confidence_batch() against get_rag_confidence().
+
+Builds the index in a temporary directory from the processed dataset plus
+Module 1 indicators, then checks the one-search batch path returns the same
+result as the per-row path for every query. Skipped without faiss.
+"""
+
+import sys
+import tempfile
+import contextlib
+import io
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+
+import src.modules.module2_sentiment as module2
+from src.modules.module1_technical import calculate_indicators
+from src.modules.module2_sentiment import SentimentAnalyzer
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+
+def test_rag_batch_matches_scalar():
+    if faiss is None:
+        print("   [SKIP] faiss not installed")
+        return
+
+    # The index only needs faiss; sentence_transformers is imported alongside
+    # it in module2 but not used, so enable RAG whenever faiss is present
+    saved = module2.FAISS_AVAILABLE, getattr(module2, 'faiss', None)
+    module2.FAISS_AVAILABLE, module2.faiss = True, faiss
+    try:
+        df = pd.read_csv(PROJECT_ROOT / 'data' / 'processed' / 'bitcoin_clean.csv')
+        df['Date'] = pd.to_datetime(df['Date'])
+        df_ind = calculate_indicators(df, df['Date'].max())
+
+        analyzer = SentimentAnalyzer(enable_rag=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            analyzer.rag_db_path = Path(tmp)
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyzer.build_rag_index(df_ind)
+
+        queries = df_ind.dropna().iloc[::17]
+        batch = analyzer.get_rag_confidence_batch(queries)
+        assert list(batch.index) == list(queries.index)
+        for (_, row), (_, result) in zip(queries.iterrows(), batch.iterrows()):
+            scalar = analyzer.get_rag_confidence(row.to_dict())
+            assert scalar['signal'] == result['signal'], (scalar, dict(result))
+            assert scalar['similar_count'] == result['similar_count'], (scalar, dict(result))
+            for key in ('confidence', 'bullish_pct', 'avg_return'):
+                assert np.isclose(scalar[key], result[key], rtol=1e-9, atol=1e-12), (key, scalar, dict(result))
+        print(f"   [OK] {len(queries)} queries: batch == per-row")
+    finally:
+        module2.FAISS_AVAILABLE, module2.faiss = saved
+
+
+if __name__ == "__main__":
+    test_rag_batch_matches_scalar()
+    print("\n[OK] RAG BATCH TEST PASSED")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Module 3 parity test: features, predictions and validation against the
+original implementation, plus the batching/caching contracts.
+
+BASELINE_* values were produced by the original (pre-optimization) module
+on data/processed/bitcoin_clean.csv.
+"""
+
+import sys
+import io
+import contextlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+
+import src.modules.module3_prediction as module3
+from src.modules.module3_prediction import (
+    BitcoinFeatureEngineer, BitcoinPricePredictor, DirectionClassifier,
+    validate_direction_classifier
+)
+
+# Last feature row of create_features(df, '2024-03-01'), blockchain proxies
+BASELINE_FEATURES = {
+    'rolling_std': 4810.01692155, 'price_change_pct': 0.2294599476,
+    'sma_ratio': 1.17031387218, 'roc_7d': 0.2294599476,
+    'momentum_oscillator': 0.145546333798, 'price_to_sma30': 1.24082552434,
+    'bb_width': 0.309561763238, 'ema_14': 55439.3026342,
+    'lr_trend': 63902.1214286, 'lr_residual': -692.686428571,
+    'hash_rate': 1.24082552434, 'block_size': 0.0531425861668,
+}
+BASELINE_FEATURE_ROWS = 2023
+
+# BitcoinPricePredictor().train(df, d) + predict(df, d)
+BASELINE_PREDICTIONS = {
+    '2021-06-01': (34641.47979322996, 'UP', 0.7049190262727372),
+    '2024-03-01': (55112.195726682556, 'DOWN', 0.6422128601748384),
+}
+
+# validate_direction_classifier(df, '2024-02-01', '2024-02-05'), retrained daily
+BASELINE_VALIDATION = {
+    'directional_accuracy': 0.4, 'avg_confidence': 0.6262842031986839,
+    'high_confidence_accuracy': 1.0, 'num_predictions': 5, 'num_high_confidence': 1,
+}
+
+
+def load_data() -> pd.DataFrame:
+    df = pd.read_csv(PROJECT_ROOT / 'data' / 'processed' / 'bitcoin_clean.csv')
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+
+def quiet(func, *args, **kwargs):
+    """Call func with its progress prints suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def test_features_match_baseline():
+    df = load_data()
+    engineer = BitcoinFeatureEngineer(use_cached_blockchain=False)
+    features = quiet(engineer.create_features, df, '2024-03-01', required_cols=None)
+    assert len(features) == BASELINE_FEATURE_ROWS, len(features)
+    for col, expected in BASELINE_FEATURES.items():
+        assert np.isclose(features[col].iloc[-1], expected, rtol=1e-9), (col, features[col].iloc[-1], expected)
+    print(f"   [OK] {len(features)} rows, {len(BASELINE_FEATURES)} features match")
+
+
+def test_predictions_match_baseline():
+    df = load_data()
+    predictor = BitcoinPricePredictor()
+    for date, (price, direction, confidence) in BASELINE_PREDICTIONS.items():
+        quiet(predictor.train, df, date)
+        result = quiet(predictor.predict, df, date)
+        assert np.isclose(result['predicted_price'], price, rtol=1e-9), (date, result['predicted_price'])
+        assert result['direction'] == direction, (date, result['direction'])
+        assert np.isclose(result['direction_confidence'], confidence, rtol=1e-9), date
+        print(f"   [OK] {date}: ${result['predicted_price']:,.2f} {direction}")
+
+
+def test_validation_matches_baseline_when_retrained_daily():
+    df = load_data()
+    result = quiet(validate_direction_classifier, df, '2024-02-01', '2024-02-05', retrain_frequency=1)
+    for key, expected in BASELINE_VALIDATION.items():
+        assert np.isclose(result[key], expected, rtol=1e-9), (key, result[key], expected)
+    print(f"   [OK] {result}")
+
+
+def test_retrain_cadence():
+    """With retrain_frequency=7 the classifier is refit once per 7 new rows."""
+    df = load_data()
+    calls = []
+    original_train = DirectionClassifier.train
+
+    def counting_train(self, *args, **kwargs):
+        calls.append(args[1] if len(args) > 1 else kwargs.get('current_date'))
+        return original_train(self, *args, **kwargs)
+
+    DirectionClassifier.train = counting_train
+    try:
+        result = quiet(validate_direction_classifier, df, '2024-02-01', '2024-02-14', retrain_frequency=7)
+    finally:
+        DirectionClassifier.train = original_train
+    assert result['num_predictions'] == 14, result
+    assert [str(pd.Timestamp(d).date()) for d in calls] == ['2024-02-01', '2024-02-08'], calls
+    print(f"   [OK] 14 predictions, {len(calls)} fits")
+
+
+def test_predict_batch_matches_predict():
+    df = load_data()
+    days = list(df['Date'].iloc[1400:1700:7])
+    for cls in (DirectionClassifier, BitcoinPricePredictor):
+        model = cls()
+        quiet(model.train, df, '2021-06-01')
+        batch = quiet(model.predict_batch, df, days)
+        for day, result in zip(days, batch):
+            single = quiet(model.predict, df, day)
+            single.pop('timestamp', None)
+            result.pop('timestamp', None)
+            assert result == single, (cls.__name__, day, result, single)
+        print(f"   [OK] {cls.__name__}: {len(days)} days identical")
+
+
+def test_window_aggregates_range_independent():
+    """Each window's row is bit-identical whatever range it is computed in."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(300, 4)) * np.array([1.0, 1e4, 1e-3, 1e6]) + np.array([0.0, 5e4, 0.0, 1e9])
+    values[50, 1] = np.nan
+    values[120, 2] = np.inf
+    saved = module3.NUMBA_AVAILABLE, module3.BOTTLENECK_AVAILABLE
+    try:
+        for numba_on, bn_on in ((True, False), (False, True), (False, False)):
+            if (numba_on and not saved[0]) or (bn_on and not saved[1]):
+                continue
+            module3.NUMBA_AVAILABLE, module3.BOTTLENECK_AVAILABLE = numba_on, bn_on
+            full = module3._window_aggregates(values, 7)
+            single = np.array([module3._window_aggregates(values[r:r + 7], 7)[0] for r in range(len(values) - 6)])
+            assert np.array_equal(full, single, equal_nan=True), (numba_on, bn_on)
+    finally:
+        module3.NUMBA_AVAILABLE, module3.BOTTLENECK_AVAILABLE = saved
+    print("   [OK] whole-range == per-window on every backend")
+
+
+def test_feature_memo_sees_in_place_edits():
+    df = load_data()
+    engineer = BitcoinFeatureEngineer(use_cached_blockchain=False)
+    date = df['Date'].iloc[-1]
+    before = quiet(engineer.create_features, df, date)['sma_20'].iloc[-5]
+    df.loc[df.index[-20], 'Price'] *= 1.5
+    after = quiet(engineer.create_features, df, date)['sma_20'].iloc[-5]
+    assert after != before, (before, after)
+    print(f"   [OK] sma_20 {before:,.2f} -> {after:,.2f} after editing an earlier row")
+
+
+def test_input_feature_columns_not_passed_through():
+    """Feature-named input columns are rebuilt or dropped, never passed through."""
+    df = load_data()
+    df['roc_7d'] = 123.0  # stale precomputed value in the input
+    engineer = BitcoinFeatureEngineer(use_cached_blockchain=False)
+    subset = quiet(engineer.create_features, df, '2024-03-01', required_cols=['rolling_std'])
+    full = quiet(engineer.create_features, df, '2024-03-01', required_cols=None)
+    assert 'roc_7d' not in subset.columns
+    assert np.isclose(full['roc_7d'].iloc[-1], BASELINE_FEATURES['roc_7d'], rtol=1e-9)
+    print("   [OK] stale roc_7d dropped (subset) / rebuilt (full)")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print("MODULE 3 PARITY TEST")
+    print("="*70)
+    test_features_match_baseline()
+    test_predictions_match_baseline()
+    test_validation_matches_baseline_when_retrained_daily()
+    test_retrain_cadence()
+    test_predict_batch_matches_predict()
+    test_window_aggregates_range_independent()
+    test_feature_memo_sees_in_place_edits()
+    test_input_feature_columns_not_passed_through()
+    print("\n[OK] MODULE 3 PARITY TEST PASSED")